@@ -0,0 +1,176 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from forecasting import INDICATOR_COLS
+
+# Backend grafik: "matplotlib" (PNG dari server), "client" (st.line_chart, dirender di browser)
+# atau "auto" (client jika jumlah titik melebihi ambang). PNG dirender sekali dan ikut di-cache
+# bersama hasil forecast; untuk backend client chart yang di-cache bernilai None
+CHART_BACKEND = os.environ.get("DES_CHART_BACKEND", "auto").lower()
+CLIENT_THRESHOLD = int(os.environ.get("DES_CHART_CLIENT_THRESHOLD", "5000"))
+
+
+def chart_backend(n_points):
+    if CHART_BACKEND in ("matplotlib", "client"):
+        return CHART_BACKEND
+    return "client" if n_points > CLIENT_THRESHOLD else "matplotlib"
+
+
+# ====================== MATPLOTLIB (PNG) ======================
+# matplotlib diimpor saat chart PNG pertama digambar, bukan saat halaman dimuat
+# (halaman dengan backend client atau tanpa chart tidak pernah memuatnya)
+def new_figure(figsize):
+    from matplotlib.figure import Figure
+    return Figure(figsize=figsize)
+
+
+def fig_to_png(fig):
+    # Render figure ke PNG. Figure dibuat tanpa pyplot, jadi tidak pernah masuk registry global
+    # dan langsung dibebaskan garbage collector setelah fungsi ini selesai
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=200, bbox_inches='tight')
+    return buf.getvalue()
+
+
+def render_forecast_chart(res, intervals):
+    fig = new_figure((12, 6))
+    ax = fig.subplots()
+
+    # Band interval prediksi (yang lebar digambar dulu)
+    for level, shade in zip(sorted(intervals, reverse=True), (0.15, 0.3)):
+        lower, upper = intervals[level]
+        ax.fill_between(res.future_years, lower, upper, color='#00D1FF', alpha=shade, linewidth=0,
+                        label=f'Interval Prediksi {level}%')
+
+    # Plot actual data
+    ax.plot(res.years, res.actual, marker='o', label='Actual GINI_Disp', color='#00E396', linewidth=2, markersize=6)
+
+    # Plot forecast (in-sample + future)
+    ax.plot(np.concatenate([res.years, res.future_years]), np.concatenate([res.forecast, res.future]),
+            marker='x', linestyle='--', label='Forecast GINI_Disp', color='#00D1FF', linewidth=2, markersize=8)
+
+    ax.set_title('Forecasting GINI Dispersion (Double Exponential Smoothing)', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Year', fontsize=12)
+    ax.set_ylabel('GINI Disp', fontsize=12)
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    return fig_to_png(fig)
+
+
+def render_alpha_curve(search):
+    fig = new_figure((12, 4))
+    ax = fig.subplots()
+    ax.plot(search.grid, search.scores[search.metric], color='#00D1FF', linewidth=2,
+            label=f'{search.metric} vs Alpha')
+    ax.axvline(search.alpha, color='#FEB019', linestyle='--', linewidth=1.5,
+               label=f'Optimum α = {search.alpha:.4f}')
+    ax.scatter([search.alpha], [search.score], color='#FEB019', zorder=3)
+    ax.set_title(f'Kurva Error In-Sample ({search.metric}) terhadap Alpha', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Alpha (α)', fontsize=12)
+    ax.set_ylabel(search.metric, fontsize=12)
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    return fig_to_png(fig)
+
+
+def render_grid_chart(search):
+    # Permukaan error alpha x beta pada phi terbaik
+    k = int(np.argmin(np.abs(search.phis - search.phi)))
+    surface = search.scores[search.metric][:, :, k]
+
+    from matplotlib.colors import LogNorm
+
+    fig = new_figure((12, 5))
+    ax = fig.subplots()
+    # Skala log: error di alpha kecil jauh lebih besar dan menenggelamkan area sekitar optimum
+    positive = surface[surface > 0]
+    norm = LogNorm(vmin=positive.min(), vmax=positive.max()) if positive.size else None
+    mesh = ax.pcolormesh(search.betas, search.alphas, surface, cmap='viridis_r', shading='nearest', norm=norm)
+    fig.colorbar(mesh, ax=ax, label=search.metric)
+    ax.scatter([search.beta], [search.alpha], color='#FEB019', marker='*', s=250, zorder=3,
+               label=f'Optimum α = {search.alpha:.2f}, β = {search.beta:.2f}, φ = {search.phi:.2f}')
+    ax.set_title(f'Permukaan Error In-Sample ({search.metric}) α x β (φ = {search.phi:.2f})',
+                 fontsize=14, fontweight='bold')
+    ax.set_xlabel('Beta (β)', fontsize=12)
+    ax.set_ylabel('Alpha (α)', fontsize=12)
+    ax.legend(loc='best', fontsize=10)
+    fig.tight_layout()
+    return fig_to_png(fig)
+
+
+def render_panel_chart(df, panel):
+    n_cols = 3
+    n_rows = -(-len(INDICATOR_COLS) // n_cols)
+    fig = new_figure((15, 4 * n_rows))
+    axes = fig.subplots(n_rows, n_cols)
+    actual = df.set_index('Year')
+    for ax, col in zip(axes.flat, INDICATOR_COLS):
+        ax.plot(actual.index, actual[col], marker='o', color='#00E396', linewidth=1.5, markersize=3, label='Aktual')
+        ax.plot(panel.table['Year'], panel.table[col], linestyle='--', color='#00D1FF', linewidth=1.5,
+                label=f'Forecast (α = {panel.alphas[col]:.2f})')
+        ax.set_title(col, fontsize=12, fontweight='bold')
+        ax.legend(loc='best', fontsize=8)
+        ax.grid(True, alpha=0.3)
+    for ax in axes.flat[len(INDICATOR_COLS):]:
+        ax.set_visible(False)
+    fig.tight_layout()
+    return fig_to_png(fig)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def interpolation_chart(version, column, _raw, _clean):
+    # PNG perbandingan interpolasi, di-cache per (versi dataset, kolom); frame tidak di-hash
+    fig = new_figure((12, 5))
+    ax = fig.subplots()
+
+    # Plot sebelum interpolasi (original dengan missing values)
+    ax.plot(_raw['Year'], _raw[column],
+            'o-', color='red', label='Before (Raw Data)', alpha=0.7, linewidth=2, markersize=8)
+
+    # Plot sesudah interpolasi
+    ax.plot(_clean['Year'], _clean[column],
+            '-', color='#00E396', label='After Interpolation', linewidth=2.5)
+
+    ax.set_title(f"Perbandingan Interpolasi: {column}", fontsize=14, fontweight='bold')
+    ax.set_xlabel("Year", fontsize=12)
+    ax.set_ylabel(column, fontsize=12)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=11)
+    fig.tight_layout()
+    return fig_to_png(fig)
+
+
+# ====================== CLIENT-SIDE (st.line_chart) ======================
+def show_forecast_client(res, intervals):
+    data = pd.DataFrame({
+        'Actual GINI_Disp': pd.Series(res.actual, index=res.years),
+        'Forecast GINI_Disp': pd.Series(np.concatenate([res.forecast, res.future]),
+                                        index=np.concatenate([res.years, res.future_years])),
+    })
+    for level, (lower, upper) in intervals.items():
+        data[f'Batas Bawah {level}%'] = pd.Series(lower, index=res.future_years)
+        data[f'Batas Atas {level}%'] = pd.Series(upper, index=res.future_years)
+    st.line_chart(data.rename_axis('Year'), use_container_width=True)
+
+
+def show_panel_client(df, panel):
+    actual = df.set_index('Year')
+    forecast = panel.table.set_index('Year')
+    cols = st.columns(3)
+    for i, col in enumerate(INDICATOR_COLS):
+        with cols[i % 3]:
+            st.caption(f"**{col}** (α = {panel.alphas[col]:.2f})")
+            st.line_chart(pd.DataFrame({'Aktual': actual[col], 'Forecast': forecast[col]}), height=220)
+
+
+def show_interpolation_client(raw, clean, column):
+    st.line_chart(pd.DataFrame({
+        'Before (Raw Data)': raw.set_index('Year')[column],
+        'After Interpolation': clean.set_index('Year')[column],
+    }), use_container_width=True)
@@ -0,0 +1,125 @@
+import os
+from collections import namedtuple
+
+import pandas as pd
+import streamlit as st
+
+from forecasting import (DATASET_PATH, INDICATOR_COLS, TARGET_COL, LRUCache, compact_frame, interpolate_frame,
+                         load_dataset, numeric_columns, profile_dataset)
+from forecasting.lookup import ALPHA_GRID, precompute_brown
+from forecasting.perf import PerfRecorder, stage
+
+# Frame hasil preprocessing dipakai bersama (read-only) oleh semua session dan
+# kedua halaman. Copy-on-Write memastikan perubahan di satu session tidak pernah
+# menulis ke frame bersama (default sejak pandas 3.0).
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# DES_COMPACT_DATA=1: indikator dengan <= 6 digit signifikan jadi float32 & Year int16 (lihat
+# forecasting.compact_frame) untuk frame bersama
+COMPACT_DATA = os.environ.get("DES_COMPACT_DATA", "0").lower() in ("1", "on", "true")
+
+# Interval prediksi dari simulasi bootstrap residual (jumlah jalur & seed tetap agar hasil bisa di-cache)
+INTERVAL_LEVELS = (80, 95)
+N_PATHS = 10000
+# Horizon terpanjang di slider periode halaman utama
+MAX_PERIODS = 20
+
+# target: Year + TARGET_COL tanpa baris kosong, urut tahun (seri yang diforecast di halaman utama)
+# filled: jumlah nilai yang diisi interpolasi per kolom numerik
+PreparedData = namedtuple("PreparedData", ["version", "raw", "clean", "filtered", "target", "filled",
+                                           "numeric_cols"])
+
+
+def dataset_version(path=DATASET_PATH):
+    """Versi dataset dari ukuran & mtime file (murah, dicek setiap rerun)."""
+    st_ = os.stat(path)
+    return f"{st_.st_size}-{st_.st_mtime_ns}"
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _prepare(path, version):
+    with stage("load"):
+        raw = load_dataset(path)
+        if COMPACT_DATA:
+            raw = compact_frame(raw)
+    with stage("interpolation"):
+        clean, filled = interpolate_frame(raw)
+    # Seleksi kolom di bawah Copy-on-Write berbagi buffer dengan `clean` (tanpa materialisasi ulang)
+    filtered = clean[['Year'] + INDICATOR_COLS]
+    target = clean[['Year', TARGET_COL]].dropna().reset_index(drop=True)
+    return PreparedData(version, raw, clean, filtered, target, filled, numeric_columns(clean))
+
+
+def get_prepared_data(path=DATASET_PATH):
+    """Data mentah, hasil sort + interpolasi, dan hasil filtering kolom.
+
+    Dihitung sekali per versi dataset lalu dibagi ke semua session tanpa copy;
+    jangan ubah frame yang dikembalikan secara in-place.
+    """
+    with stage("data"):
+        return _prepare(path, dataset_version(path))
+
+
+@st.cache_resource(max_entries=12, show_spinner=False)
+def _profile(path, version, name):
+    with stage("compute"):
+        return profile_dataset(getattr(_prepare(path, version), name))
+
+
+def get_profile(name, path=DATASET_PATH):
+    """Profil (null, dtype, describe) frame "raw", "clean" atau "filtered".
+
+    Dihitung saat pertama diminta lalu dipakai ulang semua widget dan session
+    sampai versi dataset berubah.
+    """
+    with stage(f"profile_{name}"):
+        return _profile(path, dataset_version(path), name)
+
+
+@st.cache_resource(max_entries=4, show_spinner="Menyiapkan forecast untuk semua posisi slider...")
+def _forecast_grid(path, version, levels, n_paths, max_periods):
+    target = _prepare(path, version).target
+    with stage("compute"):
+        return precompute_brown(target['Year'], target[TARGET_COL], ALPHA_GRID, max_periods, levels, n_paths, seed=0)
+
+
+def get_forecast_grid(levels, n_paths, max_periods, path=DATASET_PATH):
+    """Tabel Brown DES untuk setiap posisi slider alpha x periode (lihat forecasting.lookup).
+
+    Dihitung sekali per versi dataset (semua session berbagi); interaksi slider
+    sesudahnya cukup lookup lewat `grid_forecast`.
+    """
+    with stage("forecast_grid"):
+        return _forecast_grid(path, dataset_version(path), tuple(levels), n_paths, max_periods)
+
+
+@st.cache_resource
+def get_forecast_cache():
+    """Cache LRU hasil forecast (array + chart PNG) yang dipakai bersama semua session.
+
+    Kunci: (versi dataset, method, alpha, periods_ahead).
+    """
+    return LRUCache(maxsize=128)
+
+
+def prewarm(path=DATASET_PATH):
+    """Isi cache bersama sebelum session pertama: dataset, preprocessing, profil dan grid forecast default.
+
+    Dipanggil `serve.py` saat boot (di luar run script). Modul plotting juga
+    diimpor supaya chart pertama tidak menanggungnya. Mengembalikan
+    PerfRecorder berisi waktu per tahap.
+    """
+    recorder = PerfRecorder("prewarm", trace_memory=False)
+    with recorder.stage("data"):
+        prepared = get_prepared_data(path)
+    with recorder.stage("profiles"):
+        for name in ("raw", "clean", "filtered"):
+            get_profile(name, path)
+    if len(prepared.target) >= 4:
+        with recorder.stage("forecast_grid"):
+            get_forecast_grid(INTERVAL_LEVELS, N_PATHS, MAX_PERIODS, path)
+    with recorder.stage("plotting"):
+        # Impor yang ditunda app_charts.new_figure sampai chart pertama
+        import matplotlib.figure
+    return recorder
@@ -0,0 +1,81 @@
+import math
+import time
+from collections import namedtuple
+
+import pandas as pd
+import streamlit as st
+
+from forecasting.perf import finish_run, first_render, stage, start_run
+
+# Satu run halaman: nama, waktu mulai (perf_counter) dan recorder DES_PERF (None jika mati)
+PageRun = namedtuple("PageRun", ["page", "started", "recorder"])
+
+
+def start_page(page):
+    """Mulai run halaman: catat waktu mulai (time-to-first-render) dan pencatatan DES_PERF."""
+    return PageRun(page, time.perf_counter(), start_run(page))
+
+
+def finish_page(run):
+    """Akhiri run halaman: laporkan render pertama halaman di proses ini lalu tampilkan panel Performance."""
+    first_render(run.page, time.perf_counter() - run.started)
+    perf_panel(run.recorder)
+
+
+def paged_dataframe(df, key, page_size=500, float_format=None, **kwargs):
+    """Tampilkan DataFrame per halaman; hanya baris di halaman aktif yang dikirim ke browser.
+
+    Format angka dilakukan di sisi tampilan lewat `column_config` (data tetap
+    bertipe numerik). Jika data muat dalam satu halaman, pemilih halaman tidak
+    ditampilkan. `kwargs` diteruskan ke `st.dataframe`.
+    """
+    n_rows = len(df)
+    n_pages = max(1, math.ceil(n_rows / page_size))
+
+    page = 1
+    if n_pages > 1:
+        col_page, col_info = st.columns([1, 3])
+        with col_page:
+            page = st.number_input("Halaman", min_value=1, max_value=n_pages, value=1, step=1, key=key)
+        start = (page - 1) * page_size
+        with col_info:
+            st.caption(f"Baris {start + 1:,}–{min(start + page_size, n_rows):,} dari {n_rows:,} "
+                       f"(halaman {page} dari {n_pages})")
+
+    start = (page - 1) * page_size
+    window = df.iloc[start:start + page_size]
+
+    if float_format is not None:
+        column_config = {col: st.column_config.NumberColumn(format=float_format)
+                         for col in window.select_dtypes(include="float").columns}
+        column_config.update(kwargs.pop("column_config", None) or {})
+        kwargs["column_config"] = column_config
+
+    with stage("render_table"):
+        st.dataframe(window, **kwargs)
+
+
+def perf_panel(recorder):
+    """Akhiri pencatatan run dan tampilkan panel "Performance" di sidebar (tidak tampil jika DES_PERF mati).
+
+    Setiap tahap ditampilkan berindentasi sesuai kedalamannya; seluruh run bisa
+    diunduh sebagai JSON.
+    """
+    data = finish_run(recorder)
+    if data is None:
+        return
+
+    stages = data["stages"]
+    table = pd.DataFrame({
+        "Tahap": ["\u2003" * r["depth"] + r["stage"] for r in stages],
+        "Waktu (ms)": [r["seconds"] * 1e3 for r in stages],
+    })
+    if data["trace_memory"]:
+        table["Peak (MB)"] = [r["peak_bytes"] / 2 ** 20 for r in stages]
+
+    with st.sidebar.expander("⏱️ Performance"):
+        st.caption(f"Run `{data['run']}`: {data['total_s'] * 1e3:,.1f} ms sampai panel ini")
+        st.dataframe(table, hide_index=True, use_container_width=True,
+                     column_config={col: st.column_config.NumberColumn(format="%.2f") for col in table.columns[1:]})
+        st.download_button("Export JSON", recorder.to_json(indent=2), file_name=f"perf-{data['run']}.json",
+                           mime="application/json", use_container_width=True)
@@ -0,0 +1,213 @@
+"""Benchmark load, interpolasi, DES, metrik, tabel dan render halaman.
+
+Contoh:
+    python benchmark.py                          # semua tahap, seri 10^2..10^7
+    python benchmark.py --sizes 100 10000 --no-pages
+    python benchmark.py --compare benchmarks/abc1234.json
+
+Hasil disimpan sebagai JSON (default benchmarks/<commit>.json) supaya
+regresi antar commit bisa dibandingkan dengan --compare.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from forecasting import (DATASET_PATH, brown_des, error_metrics, forecast_panel, forecast_series, forecast_table,
+                         interpolate_numeric, load_dataset)
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZES = [10 ** p for p in range(2, 8)]
+DEFAULT_PANELS = [10, 100, 1000, 5000]
+PANEL_ROWS = 60
+ALPHA = 0.6
+PERIODS_AHEAD = 5
+
+
+# ====================== DATA SINTETIS ======================
+def synthetic_frame(n_rows, n_cols=1, missing=0.05, seed=0):
+    """Seri random walk + trend dengan kolom Year dan ~`missing` nilai hilang (selain baris pertama/terakhir)."""
+    rng = np.random.default_rng(seed)
+    values = 40 + np.cumsum(rng.normal(0.01, 0.5, size=(n_rows, n_cols)), axis=0)
+    gaps = rng.random((n_rows, n_cols)) < missing
+    gaps[[0, -1]] = False
+    values[gaps] = np.nan
+    df = pd.DataFrame(values, columns=[f"x{i}" for i in range(n_cols)])
+    df.insert(0, "Year", np.arange(n_rows) + 1000)
+    return df
+
+
+# ====================== TIMING ======================
+def measure(fn, min_time=0.2, max_repeat=20):
+    """Jalankan `fn` minimal sekali, diulang sampai total >= min_time detik atau max_repeat kali."""
+    times = []
+    while len(times) < max_repeat and sum(times) < min_time:
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"repeat": len(times), "min_s": min(times), "median_s": float(np.median(times))}
+
+
+def record(results, stage, fn, verbose=True, **params):
+    row = {"stage": stage, **params, **measure(fn)}
+    results.append(row)
+    if verbose:
+        label = " ".join(f"{k}={v}" for k, v in params.items())
+        print(f"{stage:<22} {label:<20} min {row['min_s'] * 1e3:10.3f} ms  (x{row['repeat']})", flush=True)
+    return row
+
+
+# ====================== TAHAP ======================
+def bench_dataset(results):
+    """Load dataset asli: parse Excel vs cache Parquet."""
+    record(results, "load_excel", lambda: load_dataset(DATASET_PATH, use_cache=False))
+    load_dataset(DATASET_PATH)
+    record(results, "load_cached", lambda: load_dataset(DATASET_PATH))
+
+
+def bench_series(results, sizes, workdir):
+    """Semua tahap pipeline untuk satu seri sepanjang n titik."""
+    for n in sizes:
+        df = synthetic_frame(n)
+        path = os.path.join(workdir, f"series_{n}.csv")
+        df.to_csv(path, index=False)
+        record(results, "load_csv", lambda: load_dataset(path, use_cache=False), size=n)
+        load_dataset(path)
+        record(results, "load_cached", lambda: load_dataset(path), size=n)
+
+        record(results, "interpolation", lambda: interpolate_numeric(df), size=n)
+        y = interpolate_numeric(df)["x0"].to_numpy()
+        years = df["Year"].to_numpy()
+
+        des = brown_des(y, ALPHA)
+        record(results, "smoothing", lambda: brown_des(y, ALPHA), size=n)
+        record(results, "metrics", lambda: error_metrics(y, des.forecast), size=n)
+        res = forecast_series(years, y, ALPHA, PERIODS_AHEAD)
+        record(results, "forecast_series", lambda: forecast_series(years, y, ALPHA, PERIODS_AHEAD), size=n)
+        record(results, "table_build", lambda: forecast_table(res), size=n)
+        del df, y, des, res
+        os.remove(path)
+
+
+def bench_panels(results, panels):
+    """Panel PANEL_ROWS tahun x banyak kolom: interpolasi, forecast alpha tetap dan alpha optimal."""
+    for n_cols in panels:
+        df = synthetic_frame(PANEL_ROWS, n_cols, seed=n_cols)
+        clean = interpolate_numeric(df)
+        cols = list(clean.columns[1:])
+        record(results, "panel_interpolation", lambda: interpolate_numeric(df), columns=n_cols)
+        record(results, "panel_forecast", lambda: forecast_panel(clean, cols, ALPHA, PERIODS_AHEAD),
+               columns=n_cols)
+        record(results, "panel_optimize", lambda: forecast_panel(clean, cols, None, PERIODS_AHEAD), columns=n_cols)
+
+
+def bench_pages(results):
+    """Run headless halaman Streamlit lewat AppTest; run pertama (cache dingin) dicatat terpisah."""
+    from streamlit.testing.v1 import AppTest
+
+    def run_page(page):
+        at = AppTest.from_file(os.path.join(ROOT, page), default_timeout=300)
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"{page}: {at.exception[0].value}")
+
+    for page in ["data_preparation.py", "main.py"]:
+        name = "page_" + os.path.splitext(page)[0]
+        start = time.perf_counter()
+        run_page(page)
+        first = time.perf_counter() - start
+        results.append({"stage": name + "_first", "repeat": 1, "min_s": first, "median_s": first})
+        print(f"{name + '_first':<22} {'':<20} min {first * 1e3:10.3f} ms  (x1)", flush=True)
+        record(results, name, lambda: run_page(page))
+
+
+# ====================== JSON & PERBANDINGAN ======================
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                             check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    import scipy
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "scipy": scipy.__version__,
+    }
+
+
+def _key(row):
+    return row["stage"], row.get("size"), row.get("columns")
+
+
+def compare(old, new, threshold=1.10):
+    """Cetak rasio waktu baru/lama per tahap; tahap yang lebih lambat dari `threshold` ditandai."""
+    before = {_key(row): row for row in old["results"]}
+    print(f"\nBanding dengan {old['environment'].get('commit')} ({old['environment'].get('timestamp')})")
+    regressions = 0
+    for row in new["results"]:
+        ref = before.get(_key(row))
+        if ref is None:
+            continue
+        ratio = row["min_s"] / ref["min_s"] if ref["min_s"] > 0 else float("inf")
+        flag = "  <-- lebih lambat" if ratio > threshold else ""
+        regressions += ratio > threshold
+        label = " ".join(f"{k}={v}" for k, v in zip(("size", "columns"), _key(row)[1:]) if v is not None)
+        print(f"{row['stage']:<22} {label:<20} {ref['min_s'] * 1e3:10.3f} -> {row['min_s'] * 1e3:10.3f} ms"
+              f"  x{ratio:5.2f}{flag}")
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline forecasting DES.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Panjang seri sintetis")
+    parser.add_argument("--panels", type=int, nargs="+", default=DEFAULT_PANELS, help="Jumlah kolom panel sintetis")
+    parser.add_argument("--no-pages", action="store_true", help="Lewati run halaman Streamlit")
+    parser.add_argument("--output", help="File JSON hasil (default: benchmarks/<commit>.json)")
+    parser.add_argument("--compare", metavar="JSON", help="Hasil benchmark lama untuk dibandingkan")
+    parser.add_argument("--threshold", type=float, default=1.10, help="Rasio waktu yang dianggap regresi")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    results = []
+    bench_dataset(results)
+    with tempfile.TemporaryDirectory() as workdir:
+        bench_series(results, args.sizes, workdir)
+    bench_panels(results, args.panels)
+    if not args.no_pages:
+        bench_pages(results)
+
+    report = {"environment": environment(), "results": results}
+    output = args.output or os.path.join(ROOT, "benchmarks", f"{report['environment']['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nHasil disimpan ke {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
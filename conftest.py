@@ -0,0 +1 @@
+# Kosong: keberadaan file ini membuat pytest menambahkan root repo ke sys.path (import forecasting dari tests/)
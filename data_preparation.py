@@ -1,14 +1,19 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
 # from sklearn.preprocessing import StandardScaler
-import os
+
+from app_charts import chart_backend, interpolation_chart, show_interpolation_client
+from app_data import get_prepared_data, get_profile
+from app_ui import finish_page, paged_dataframe, start_page
+from forecasting import INDICATOR_COLS
+from forecasting.perf import stage
 
 # ====================== PAGE CONFIG & STYLE ======================
 st.set_page_config(page_title="Data Preparation - DES", layout="wide")
 
+# Waktu render pertama (log server) + pencatatan per tahap (aktif lewat DES_PERF) di panel Performance sidebar
+page_run = start_page("data_preparation")
+
 st.markdown("""
 <style>
     .main {background-color: #0E1117; color: #E5E7EB;}
@@ -30,15 +35,11 @@ st.markdown("# Data Preparation")
 st.markdown("*Data Cleaning, Transformation, dan Exploration untuk Income Inequality South Africa*")
 
 # ====================== LOAD DATA ======================
-@st.cache_data
-def load_raw_data():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(script_dir, "Income Inequality in South Africa_Dataset.xlsx")
-    df = pd.read_excel(file_path)
-    return df
+# Preprocessing dihitung sekali per versi dataset dan dibagi ke semua session (read-only)
+prepared = get_prepared_data()
 
 # Load dataset
-df_original = load_raw_data().copy()
+df_original = prepared.raw
 
 st.markdown("---")
 st.markdown("## 📥 STEP 1: Data Loading & Initial Exploration")
@@ -47,8 +48,8 @@ st.markdown("""
 <div class='info-box'>
 <strong>📌 Penjelasan Step 1:</strong><br>
 ✓ Membaca file Excel yang berisi data Income Inequality South Africa<br>
-✓ Menggunakan @st.cache_data untuk optimasi performa (data tidak reload setiap kali interaksi)<br>
-✓ Menyimpan copy original untuk perbandingan sebelum vs sesudah preprocessing
+✓ Menggunakan @st.cache_resource untuk optimasi performa (data diproses sekali dan dipakai bersama semua user)<br>
+✓ Menyimpan data original untuk perbandingan sebelum vs sesudah preprocessing
 </div>
 """, unsafe_allow_html=True)
 
@@ -59,7 +60,7 @@ with col1:
 with col2:
     st.metric("Total Columns", df_original.shape[1])
 with col3:
-    st.metric("Missing Values", df_original.isnull().sum().sum())
+    st.metric("Missing Values", get_profile("raw").total_missing)
 
 # Preview data
 st.subheader("Data Preview (First 5 Rows)")
@@ -69,32 +70,26 @@ st.dataframe(df_original.head(), use_container_width=True)
 st.subheader("Data Information")
 tabs1 = st.tabs(["Data Types", "Summary Statistics", "Missing Values"])
 
+# Profil (null, dtype, describe) dihitung sekali per versi dataset lalu dipakai ulang
+profile_raw = get_profile("raw")
+
 with tabs1[0]:
     st.write("**Column Data Types:**")
-    info_df = pd.DataFrame({
-        "Column": df_original.columns,
-        "Data Type": df_original.dtypes.astype(str),
-        "Non-Null Count": df_original.count(),
-        "Null Count": df_original.isnull().sum()
-    })
-    st.dataframe(info_df, use_container_width=True, hide_index=True)
+    st.dataframe(profile_raw.info, use_container_width=True, hide_index=True)
 
 with tabs1[1]:
     st.write("**Summary Statistics (Descriptive):**")
-    st.dataframe(df_original.describe(), use_container_width=True)
+    st.dataframe(profile_raw.describe, use_container_width=True)
 
 with tabs1[2]:
     st.write("**Missing Values per Column:**")
-    missing_df = pd.DataFrame({
-        "Column": df_original.columns,
-        "Missing Count": df_original.isnull().sum(),
-        "Missing %": (df_original.isnull().sum() / len(df_original) * 100).round(2)
-    })
+    missing_df = profile_raw.missing
     st.dataframe(missing_df[missing_df["Missing Count"] > 0], use_container_width=True, hide_index=True)
 
-# Display full dataset
+# Display full dataset (baru dirender kalau diminta)
 with st.expander("📊 View Full Dataset"):
-    st.dataframe(df_original, use_container_width=True, hide_index=True)
+    if st.toggle("Tampilkan seluruh data", key="show_full_dataset"):
+        paged_dataframe(df_original, key="page_full_dataset", use_container_width=True, hide_index=True)
 
 st.markdown("---")
 st.markdown("## 🔧 STEP 2: Data Sorting & Interpolation")
@@ -104,34 +99,31 @@ st.markdown("""
 <strong>📌 Penjelasan Step 2:</strong><br>
 ✓ Mengurutkan data berdasarkan Year (wajib untuk time series interpolation)<br>
 ✓ Mengidentifikasi kolom numerik (menghilangkan Year dari daftar interpolasi)<br>
-✓ Melakukan Linear Interpolation untuk mengisi missing values dengan nilai yang proporsional antara dua data terdekat<br>
+✓ Melakukan Linear Interpolation untuk mengisi missing values dengan nilai yang proporsional antara dua data terdekat (dibobot jarak Year sebenarnya)<br>
 ✓ Linear Interpolation cocok karena trend data yang smooth dan consistent
 </div>
 """, unsafe_allow_html=True)
 
-# Sort dan Interpolasi
-df_clean = df_original.sort_values(by='Year').reset_index(drop=True)
+# Sort dan Interpolasi (sudah dihitung di tahap preprocessing bersama)
+df_clean = prepared.clean
 
 # Ambil kolom numerik selain Year
-numeric_cols = df_clean.select_dtypes(include='number').columns.tolist()
-if 'Year' in numeric_cols:
-    numeric_cols.remove('Year')
-
-# Lakukan interpolasi
-for col in numeric_cols:
-    df_clean[col] = df_clean[col].interpolate(method='linear')
+numeric_cols = prepared.numeric_cols
 
 st.success("✅ Data telah disort berdasarkan Year dan dilakukan interpolasi linear")
 
 # Tampilkan hasil interpolasi
 st.subheader("Data Setelah Interpolasi")
-col1, col2 = st.columns(2)
+col1, col2, col3 = st.columns(3)
 with col1:
     st.write("**Missing Values Sebelum Interpolasi:**")
-    st.dataframe(df_original.isnull().sum(), use_container_width=True)
+    st.dataframe(profile_raw.nulls, use_container_width=True)
 with col2:
     st.write("**Missing Values Sesudah Interpolasi:**")
-    st.dataframe(df_clean.isnull().sum(), use_container_width=True)
+    st.dataframe(get_profile("clean").nulls, use_container_width=True)
+with col3:
+    st.write("**Nilai yang Diisi Interpolasi:**")
+    st.dataframe(prepared.filled.rename("Diisi"), use_container_width=True)
 
 st.markdown("---")
 st.markdown("## 📈 STEP 3: Visualisasi Interpolasi - Before vs After")
@@ -146,27 +138,23 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Pilih kolom untuk visualisasi interpolasi
-selected_col_interp = st.selectbox("Pilih Kolom untuk Visualisasi Interpolasi:", numeric_cols)
 
-fig, ax = plt.subplots(figsize=(12, 5))
+# Fragment: ganti kolom hanya me-rerun bagian chart ini, bukan seluruh halaman
+@st.fragment
+def interpolation_section():
+    # Pilih kolom untuk visualisasi interpolasi
+    selected_col_interp = st.selectbox("Pilih Kolom untuk Visualisasi Interpolasi:", numeric_cols)
 
-# Plot sebelum interpolasi (original dengan missing values)
-ax.plot(df_original['Year'], df_original[selected_col_interp],
-        'o-', color='red', label='Before (Raw Data)', alpha=0.7, linewidth=2, markersize=8)
+    # Chart di-cache per (versi dataset, kolom); seri panjang digambar di browser
+    with stage("interpolation_chart"):
+        if chart_backend(len(df_clean)) == "matplotlib":
+            st.image(interpolation_chart(prepared.version, selected_col_interp, df_original, df_clean),
+                     use_container_width=True)
+        else:
+            show_interpolation_client(df_original, df_clean, selected_col_interp)
 
-# Plot sesudah interpolasi
-ax.plot(df_clean['Year'], df_clean[selected_col_interp],
-        '-', color='#00E396', label='After Interpolation', linewidth=2.5)
 
-ax.set_title(f"Perbandingan Interpolasi: {selected_col_interp}", fontsize=14, fontweight='bold')
-ax.set_xlabel("Year", fontsize=12)
-ax.set_ylabel(selected_col_interp, fontsize=12)
-ax.grid(True, alpha=0.3)
-ax.legend(fontsize=11)
-plt.tight_layout()
-
-st.pyplot(fig)
+interpolation_section()
 
 st.markdown("---")
 st.markdown("## 🎯 STEP 4: Column Selection & Filtering")
@@ -181,22 +169,11 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Define selected columns
-selected_cols = [
-    'Year',
-    'gini_disp',           # Gini - Disposable Income (target variable)
-    'gini_mkt',            # Gini - Market Income
-    'Inflation rate',      # Inflation rate
-    'GDP',                 # Gross Domestic Product
-    'GOVEDU',              # Government Education Spending
-    'GOVEXP',              # Government Expenditure
-    'FINDEV 1',            # Financial Development
-    'DEMOCRACY',           # Democracy Index
-    'FLABOUR'              # Labour Force
-]
+# Define selected columns (dipakai juga oleh mode batch di halaman forecast)
+selected_cols = ['Year'] + INDICATOR_COLS
 
 # Filter dataframe
-df_filtered = df_clean[selected_cols].copy()
+df_filtered = prepared.filtered
 
 st.subheader("Kolom yang Dipilih untuk Analisis")
 col_info = pd.DataFrame({
@@ -218,11 +195,11 @@ col_info = pd.DataFrame({
 st.dataframe(col_info, use_container_width=True, hide_index=True)
 
 st.subheader("Data Hasil Filtering")
-st.dataframe(df_filtered, use_container_width=True, hide_index=True)
+paged_dataframe(df_filtered, key="page_filtered", use_container_width=True, hide_index=True)
 
 # Summary
 st.subheader("📊 Summary Statistik Filtered Data")
-st.dataframe(df_filtered.describe(), use_container_width=True)
+st.dataframe(get_profile("filtered").describe, use_container_width=True)
 
 st.markdown("---")
 st.markdown("## ✅ Data Preparation Complete!")
@@ -239,6 +216,8 @@ st.success("""
     df_filtered.shape[1]
 ), icon="✅")
 
+finish_page(page_run)
+
 # # Download prepared data
 # st.subheader("💾 Download Data yang Sudah Diproses")
 # csv = df_filtered.to_csv(index=False)
@@ -0,0 +1,74 @@
+from .backtest import rolling_backtest
+from .batch import PanelForecast, forecast_panel
+from .cache import cached_read, file_fingerprint
+from .cli import run_backtests, run_forecasts
+from .data import (DATASET_PATH, INDICATOR_COLS, TARGET_COL, DatasetProfile, Interpolation, compact_frame,
+                   interpolate_frame, interpolate_numeric, load_clean_data, load_dataset, numeric_columns,
+                   profile_dataset)
+from .des import DESResult, brown_des, future_forecast
+from .holt import (METHODS, GridSearch, HoltResult, brown_params, damped_steps, grid_search, holt_des,
+                   holt_future)
+from .intervals import prediction_intervals, simulate_paths
+from .lookup import ALPHA_GRID, BrownGrid, grid_forecast, grid_index, precompute_brown
+from .memo import LRUCache
+from .metrics import METRICS, error_metrics
+from .optimize import AlphaSearch, optimize_alpha
+from .perf import PerfRecorder, finish_run, start_run
+from .series import SeriesForecast, forecast_series, forecast_table
+from .state import DESState
+from .stream import StreamSummary, iter_chunks, stream_forecast
+
+__all__ = [
+    "DESResult",
+    "brown_des",
+    "future_forecast",
+    "METRICS",
+    "error_metrics",
+    "HoltResult",
+    "GridSearch",
+    "METHODS",
+    "brown_params",
+    "holt_des",
+    "damped_steps",
+    "holt_future",
+    "grid_search",
+    "AlphaSearch",
+    "optimize_alpha",
+    "SeriesForecast",
+    "forecast_series",
+    "forecast_table",
+    "DESState",
+    "rolling_backtest",
+    "simulate_paths",
+    "prediction_intervals",
+    "ALPHA_GRID",
+    "BrownGrid",
+    "precompute_brown",
+    "grid_index",
+    "grid_forecast",
+    "PanelForecast",
+    "forecast_panel",
+    "run_forecasts",
+    "run_backtests",
+    "StreamSummary",
+    "iter_chunks",
+    "stream_forecast",
+    "DATASET_PATH",
+    "INDICATOR_COLS",
+    "TARGET_COL",
+    "load_dataset",
+    "numeric_columns",
+    "Interpolation",
+    "interpolate_frame",
+    "interpolate_numeric",
+    "load_clean_data",
+    "compact_frame",
+    "DatasetProfile",
+    "profile_dataset",
+    "cached_read",
+    "file_fingerprint",
+    "LRUCache",
+    "PerfRecorder",
+    "start_run",
+    "finish_run",
+]
@@ -0,0 +1,92 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .des import brown_des
+from .holt import damped_steps, holt_des
+from .metrics import METRICS, error_metrics
+
+
+def _fit(y, alphas, beta, phi):
+    # Brown (beta None) atau Holt/damped dengan beta & phi tetap untuk seluruh grid alpha
+    if beta is None:
+        return brown_des(y, alphas)
+    return holt_des(y, alphas, beta, phi)
+
+
+def _origin_states(y, alphas, min_train, window, beta, phi):
+    """Level & trend di setiap origin, berbentuk (k, jumlah origin), plus index origin.
+
+    Expanding window (window None): rekursi DES kausal, jadi state hasil fit
+    y[:o+1] sama dengan state full-run di t=o; cukup satu kali fit.
+    Rolling window: setiap jendela y[o-window+1:o+1] menjadi satu kolom panel
+    sehingga semua origin dihitung dalam satu sapuan.
+    """
+    if window is None:
+        fit = _fit(y, alphas, beta, phi)
+        origins = np.arange(min_train - 1, len(y))
+        return fit.level[:, origins], fit.trend[:, origins], origins
+
+    windows = sliding_window_view(y, window).T   # (window, jumlah origin)
+    fit = _fit(windows, alphas, beta, phi)
+    origins = np.arange(window - 1, len(y))
+    return fit.level[:, -1], fit.trend[:, -1], origins
+
+
+def _backtest_chunk(y, alphas, horizons, min_train, window, beta, phi):
+    level, trend, origins = _origin_states(y, alphas, min_train, window, beta, phi)
+    steps = damped_steps(phi, max(horizons))[0]
+    rows = []
+    for h in horizons:
+        usable = origins + h < len(y)
+        if not usable.any():
+            continue
+        actual = y[origins[usable] + h]
+        pred = level[:, usable] + trend[:, usable] * steps[h - 1]
+        scores = error_metrics(actual, pred)
+        rows.append(pd.DataFrame({"alpha": alphas, "horizon": h, "n_origins": int(usable.sum()),
+                                  **{m: scores[m] for m in METRICS}}))
+    return pd.concat(rows, ignore_index=True) if rows else None
+
+
+def rolling_backtest(y, alphas, horizons, min_train=4, window=None, n_jobs=1, chunk_size=None,
+                     beta=None, phi=1.0):
+    """Backtest rolling-origin forecast h-langkah DES untuk grid alpha x horizon.
+
+    Dari setiap origin o (minimal `min_train` observasi, atau tepat `window`
+    observasi terakhir untuk rolling window) dibuat forecast a[o] + b[o] * h
+    lalu dibandingkan dengan y[o+h]. Tanpa `beta` modelnya Brown; dengan
+    `beta` (dan `phi`) modelnya Holt linear/damped dengan trend dikali
+    phi + ... + phi^h. Semua origin dihitung sekaligus secara
+    vektor; grid alpha dipecah per `chunk_size` dan dijalankan paralel di
+    process pool jika `n_jobs` > 1.
+
+    Hasilnya tabel error per (alpha, horizon): n_origins, MAE, MSE, RMSE, MAPE.
+    """
+    y = np.asarray(y, dtype=float)
+    alphas = np.atleast_1d(np.asarray(alphas, dtype=float))
+    horizons = [int(h) for h in np.atleast_1d(horizons)]
+    if min(horizons) < 1:
+        raise ValueError("horizon minimal 1")
+    if window is not None and not 2 <= window <= len(y):
+        raise ValueError("window harus di antara 2 dan panjang data")
+    if window is None and not 1 <= min_train <= len(y):
+        raise ValueError("min_train harus di antara 1 dan panjang data")
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(alphas) // max(n_jobs, 1)))
+    chunks = [alphas[i:i + chunk_size] for i in range(0, len(alphas), chunk_size)]
+    args = (horizons, min_train, window, beta, phi)
+
+    if n_jobs > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            parts = list(pool.map(_backtest_chunk, [y] * len(chunks), chunks, *[[a] * len(chunks) for a in args]))
+    else:
+        parts = [_backtest_chunk(y, chunk, *args) for chunk in chunks]
+
+    parts = [part for part in parts if part is not None]
+    if not parts:
+        raise ValueError("Data terlalu pendek untuk horizon yang diminta")
+    return pd.concat(parts, ignore_index=True).sort_values(["horizon", "alpha"], ignore_index=True)
@@ -0,0 +1,67 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .des import alpha_blocks, brown_des, future_forecast
+from .metrics import METRICS, error_metrics
+
+# Hasil forecast panel: tabel forecast gabungan, metrik per seri, alpha per seri
+PanelForecast = namedtuple("PanelForecast", ["table", "metrics", "alphas"])
+
+
+def forecast_panel(df, columns, alpha, periods_ahead, year_col='Year',
+                   metric="MSE", grid_size=2000, bounds=(0.01, 0.99)):
+    """Brown DES untuk banyak kolom sekaligus sebagai matriks (tahun x seri).
+
+    Hanya baris di mana semua `columns` terisi yang dipakai, sehingga rekursi
+    berjalan kolom-per-kolom dalam satu sapuan `brown_des`. Jika `alpha` None,
+    alpha terbaik per seri dipilih dari grid alpha menurut `metric`; grid
+    dievaluasi per blok (`alpha_blocks`) dengan argmin berjalan per seri,
+    jadi memori O(blok x tahun x seri), bukan O(grid x tahun x seri).
+
+    `table` berisi Year, Periode ("In-sample"/"Prediksi") dan forecast tiap
+    kolom; `metrics` adalah matriks seri x (MAE, MSE, RMSE, MAPE).
+    """
+    columns = list(columns)
+    data = df[[year_col] + columns].dropna().sort_values(year_col)
+    if len(data) < 4:
+        raise ValueError("Minimal 4 data diperlukan untuk Double Exponential Smoothing")
+
+    Y = data[columns].to_numpy(dtype=float)
+    years = data[year_col].to_numpy().astype(int)
+
+    alphas = np.linspace(*bounds, grid_size) if alpha is None else np.array([alpha], dtype=float)
+    cols = np.arange(len(columns))
+    best = np.zeros(len(columns), dtype=int)
+    best_score = np.full(len(columns), np.inf)
+    forecast = np.empty(Y.shape)
+    future = np.empty((periods_ahead, len(columns)))
+    scores = {name: np.empty(len(columns)) for name in METRICS}
+
+    # Argmin berjalan per seri: alpha di blok baru hanya menang jika skornya lebih kecil,
+    # sehingga hasilnya sama dengan nanargmin atas seluruh grid (minimum pertama)
+    start = 0
+    for block in alpha_blocks(alphas, Y.size):
+        des = brown_des(Y, block)
+        block_scores = error_metrics(Y, des.forecast)
+        score = np.where(np.isnan(block_scores[metric]), np.inf, block_scores[metric])
+        rows = np.argmin(score, axis=0)
+        take = (score[rows, cols] < best_score) | (start == 0)
+        rows, idx = rows[take], cols[take]
+        best[idx] = start + rows
+        best_score[idx] = score[rows, idx]
+        forecast[:, idx] = des.forecast[rows, :, idx].T
+        future[:, idx] = future_forecast(des, periods_ahead)[rows, :, idx].T
+        for name in METRICS:
+            scores[name][idx] = block_scores[name][rows, idx]
+        start += len(block)
+
+    table = pd.DataFrame(np.vstack([forecast, future]), columns=columns)
+    table.insert(0, year_col, np.concatenate([years, years[-1] + np.arange(1, periods_ahead + 1)]))
+    table.insert(1, "Periode", ["In-sample"] * len(years) + ["Prediksi"] * periods_ahead)
+
+    metrics = pd.DataFrame(scores, index=columns)
+    metrics.index.name = "Seri"
+
+    return PanelForecast(table, metrics, pd.Series(alphas[best], index=columns, name="alpha"))
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from .perf import stage
+
+CACHE_VERSION = 1
+
+
+def file_fingerprint(path, chunk_size=1 << 20):
+    """Ukuran, mtime (ns) dan hash SHA-256 isi file."""
+    st = os.stat(path)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest.hexdigest()}
+
+
+def cache_paths(path):
+    """Lokasi cache Parquet + metadata JSON, di folder yang sama dengan file sumber."""
+    folder, name = os.path.split(os.path.abspath(path))
+    base = os.path.join(folder, f".{name}.cache")
+    return base + ".parquet", base + ".json"
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("version") == CACHE_VERSION else None
+
+
+def _dump_meta(path, meta):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+
+def _write_atomic(path, write):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _cache_errors():
+    # Error baca/tulis cache yang tidak boleh menggagalkan load. Dievaluasi hanya saat
+    # ada exception, jadi pyarrow (opsional) tidak diimpor di jalur normal. ArrowTypeError
+    # (kolom object berisi campuran tipe) adalah turunan TypeError, bukan ValueError
+    try:
+        from pyarrow import ArrowException
+    except ImportError:
+        return ImportError, OSError, ValueError, TypeError
+    return ImportError, OSError, ValueError, TypeError, ArrowException
+
+
+def cached_read(path, reader):
+    """Baca `path` lewat cache Parquet kolumnar; `reader(path)` hanya dipanggil saat cache basi.
+
+    Jika ukuran & mtime file sama dengan metadata, cache langsung dipakai tanpa
+    membaca file sumber. Jika berbeda, hash isi file dihitung ulang: isi sama
+    (mis. file hanya di-touch) cukup memperbarui metadata, isi berbeda membuat
+    cache dibangun ulang. Kegagalan membaca/menulis cache (folder read-only,
+    pyarrow tidak terpasang, kolom yang tidak bisa dikonversi ke Arrow) tidak
+    menggagalkan load: hasil `reader` tetap dikembalikan.
+    """
+    data_path, meta_path = cache_paths(path)
+    meta = _read_meta(meta_path)
+    st = os.stat(path)
+
+    if meta is not None and os.path.exists(data_path):
+        fresh = meta["size"] == st.st_size and meta["mtime_ns"] == st.st_mtime_ns
+        if not fresh:
+            fingerprint = file_fingerprint(path)
+            fresh = fingerprint["sha256"] == meta["sha256"]
+            if fresh:
+                meta.update(fingerprint)
+                try:
+                    _write_atomic(meta_path, lambda p: _dump_meta(p, meta))
+                except OSError:
+                    pass
+        if fresh:
+            try:
+                with stage("read_cache"):
+                    return pd.read_parquet(data_path)
+            except _cache_errors():
+                pass
+
+    fingerprint = file_fingerprint(path)
+    with stage("parse"):
+        df = reader(path)
+    meta = {"version": CACHE_VERSION, "source": os.path.basename(path), **fingerprint}
+    try:
+        with stage("write_cache"):
+            _write_atomic(data_path, lambda p: df.to_parquet(p, index=False))
+            _write_atomic(meta_path, lambda p: _dump_meta(p, meta))
+    except _cache_errors():
+        pass
+    return df
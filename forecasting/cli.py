@@ -0,0 +1,136 @@
+import argparse
+import os
+
+import pandas as pd
+
+from .backtest import rolling_backtest
+from .batch import forecast_panel
+from .data import INDICATOR_COLS, load_clean_data
+from .stream import stream_forecast
+
+
+def run_forecasts(paths, alphas, periods_ahead, columns=None, metric="MSE", use_cache=True):
+    """Forecast setiap kombinasi file x alpha tanpa Streamlit.
+
+    Alpha None berarti alpha dioptimasi per seri menurut `metric`. Hasilnya
+    dua DataFrame format long: forecast (source, alpha_setting, Year, Periode,
+    Seri, Forecast) dan metrik (source, alpha_setting, Seri, alpha, MAE, ...).
+    """
+    forecasts, metrics = [], []
+    for path in paths:
+        df = load_clean_data(path, use_cache=use_cache)
+        cols = columns or [col for col in INDICATOR_COLS if col in df.columns]
+        for alpha in alphas:
+            panel = forecast_panel(df, cols, alpha, periods_ahead, metric=metric)
+            key = {"source": os.path.basename(path),
+                   "alpha_setting": "optimize" if alpha is None else f"{alpha:g}"}
+
+            table = panel.table.melt(id_vars=['Year', 'Periode'], var_name='Seri', value_name='Forecast')
+            forecasts.append(pd.DataFrame(key, index=table.index).join(table))
+
+            scores = panel.metrics.reset_index()
+            scores.insert(1, "alpha", panel.alphas.to_numpy())
+            metrics.append(pd.DataFrame(key, index=scores.index).join(scores))
+
+    return (pd.concat(forecasts, ignore_index=True),
+            pd.concat(metrics, ignore_index=True))
+
+
+def run_backtests(paths, alphas, max_horizon, columns=None, n_jobs=1, use_cache=True):
+    """Backtest rolling-origin untuk setiap file x kolom pada grid alpha x horizon 1..max_horizon.
+
+    Hasilnya tabel long: source, Seri, alpha, horizon, n_origins, MAE, MSE, RMSE, MAPE.
+    """
+    tables = []
+    for path in paths:
+        df = load_clean_data(path, use_cache=use_cache)
+        cols = columns or [col for col in INDICATOR_COLS if col in df.columns]
+        for col in cols:
+            y = df[col].dropna().to_numpy(dtype=float)
+            table = rolling_backtest(y, alphas, range(1, max_horizon + 1), n_jobs=n_jobs)
+            table.insert(0, "Seri", col)
+            table.insert(0, "source", os.path.basename(path))
+            tables.append(table)
+    return pd.concat(tables, ignore_index=True)
+
+
+def _alpha(value):
+    alpha = float(value)
+    if not 0 < alpha <= 1:
+        raise argparse.ArgumentTypeError("alpha harus di rentang (0, 1]")
+    return alpha
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m forecasting",
+        description="Forecast Double Exponential Smoothing (Brown) untuk banyak file dan alpha.")
+    parser.add_argument("inputs", nargs="+", help="File dataset (.xlsx, .csv atau .parquet)")
+    parser.add_argument("--alpha", type=_alpha, nargs="+", default=[0.6], help="Satu atau lebih nilai alpha")
+    parser.add_argument("--optimize", action="store_true", help="Tambahkan run dengan alpha optimal per seri")
+    parser.add_argument("--metric", choices=["MSE", "MAE", "MAPE"], default="MSE",
+                        help="Metrik untuk --optimize")
+    parser.add_argument("--periods", type=int, default=5, help="Periode prediksi ke depan (tahun)")
+    parser.add_argument("--columns", nargs="+", help="Kolom yang diforecast (default: semua indikator)")
+    parser.add_argument("--output-dir", default="results", help="Folder output")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv", help="Format file output")
+    parser.add_argument("--backtest", type=int, metavar="H",
+                        help="Tambahkan backtest rolling-origin untuk horizon 1..H (grid dari --alpha)")
+    parser.add_argument("--jobs", type=int, default=1, help="Jumlah proses untuk backtest")
+    parser.add_argument("--no-cache", action="store_true", help="Selalu parse ulang file input (tanpa cache Parquet)")
+    parser.add_argument("--entity", metavar="COL",
+                        help="Kolom entitas (negara/region) untuk panel besar: CSV/Parquet dibaca per chunk dan "
+                             "diforecast per entitas")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="Baris per chunk untuk --entity")
+    parser.add_argument("--unsorted", action="store_true",
+                        help="Baris satu entitas tidak berurutan (partisi hash ke file sementara)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.periods < 1:
+        raise SystemExit("--periods minimal 1")
+
+    alphas = list(args.alpha) + ([None] if args.optimize else [])
+    if args.entity:
+        return _main_stream(args, alphas)
+    forecasts, metrics = run_forecasts(args.inputs, alphas, args.periods, args.columns, args.metric,
+                                       use_cache=not args.no_cache)
+
+    outputs = [("forecasts", forecasts), ("metrics", metrics)]
+    if args.backtest:
+        outputs.append(("backtest", run_backtests(args.inputs, args.alpha, args.backtest, args.columns,
+                                                  n_jobs=args.jobs, use_cache=not args.no_cache)))
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for name, df in outputs:
+        path = os.path.join(args.output_dir, f"{name}.{args.format}")
+        if args.format == "csv":
+            df.to_csv(path, index=False)
+        else:
+            df.to_parquet(path, index=False)
+        print(f"{path}: {len(df)} baris")
+    return 0
+
+
+def _main_stream(args, alphas):
+    # Mode panel besar: setiap input ditulis inkremental ke folder output sendiri jika lebih dari satu
+    if args.backtest:
+        raise SystemExit("--backtest belum didukung bersama --entity")
+    for path in args.inputs:
+        output_dir = args.output_dir
+        if len(args.inputs) > 1:
+            output_dir = os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0])
+        try:
+            summary = stream_forecast(path, args.entity, alphas, args.periods, output_dir, args.columns,
+                                      metric=args.metric, chunksize=args.chunksize, n_jobs=args.jobs,
+                                      presorted=not args.unsorted, fmt=args.format)
+        except ValueError as exc:
+            # Input tidak valid (mis. entitas tidak berurutan tanpa --unsorted): pesan, bukan traceback
+            raise SystemExit(f"{path}: {exc}")
+        print(f"{path}: {summary.entities} entitas, {summary.rows} baris -> {summary.forecasts_path}, "
+              f"{summary.metrics_path}")
+        if summary.skipped:
+            print(f"  {len(summary.skipped)} entitas dilewati (< 4 tahun lengkap)")
+    return 0
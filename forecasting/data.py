@@ -0,0 +1,196 @@
+import os
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .cache import cached_read
+
+# Lokasi dataset default (di root repo, satu folder di atas package)
+DATASET_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "Income Inequality in South Africa_Dataset.xlsx")
+
+# Kolom indikator yang dipakai untuk analisis & forecasting (selain Year)
+TARGET_COL = 'gini_disp'
+
+INDICATOR_COLS = [
+    'gini_disp',           # Gini - Disposable Income (target variable)
+    'gini_mkt',            # Gini - Market Income
+    'Inflation rate',      # Inflation rate
+    'GDP',                 # Gross Domestic Product
+    'GOVEDU',              # Government Education Spending
+    'GOVEXP',              # Government Expenditure
+    'FINDEV 1',            # Financial Development
+    'DEMOCRACY',           # Democracy Index
+    'FLABOUR'              # Labour Force
+]
+
+# Hasil interpolasi: frame terisi + jumlah sel yang diisi per kolom numerik
+Interpolation = namedtuple("Interpolation", ["frame", "filled"])
+
+# Profil dataset untuk halaman eksplorasi: jumlah null per kolom, info dtype, tabel missing, describe()
+DatasetProfile = namedtuple("DatasetProfile", ["n_rows", "n_cols", "nulls", "total_missing", "info", "missing",
+                                               "describe"])
+
+
+def load_dataset(path=DATASET_PATH, use_cache=True):
+    """Baca dataset dari file Excel, CSV atau Parquet (ditentukan dari ekstensi).
+
+    Excel dan CSV dibaca lewat cache Parquet di samping file sumber (lihat
+    `forecasting.cache`), sehingga parsing ulang hanya terjadi saat file berubah.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".xlsx", ".xls"):
+        reader = pd.read_excel
+    elif ext == ".csv":
+        reader = pd.read_csv
+    elif ext == ".parquet":
+        return pd.read_parquet(path)
+    else:
+        raise ValueError(f"Format file tidak didukung: {path}")
+    return cached_read(path, reader) if use_cache else reader(path)
+
+
+def numeric_columns(df, year_col='Year'):
+    """Kolom numerik selain kolom tahun."""
+    return [col for col in df.select_dtypes(include='number').columns if col.lower() != year_col.lower()]
+
+
+def interpolate_frame(df, year_col='Year', limit=None):
+    """Sort berdasarkan tahun lalu interpolasi linear semua kolom numerik dalam satu operasi blok.
+
+    Bobot interpolasi memakai jarak `year_col` sebenarnya, sehingga celah tahun
+    yang tidak rata (mis. 2001, 2002, 2005) ikut diperhitungkan. Seperti
+    `Series.interpolate`, nilai sebelum data valid pertama tetap NaN dan nilai
+    setelah data valid terakhir diisi nilai terakhir. `limit` membatasi jumlah
+    NaN berturut-turut yang diisi per celah (sisanya tetap NaN).
+
+    Mengembalikan `Interpolation(frame, filled)`: DataFrame baru (`df` tidak
+    diubah) dan jumlah sel yang diisi per kolom.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit minimal 1")
+    # Sort berdasarkan tahun (wajib biar interpolasinya benar)
+    df = df.sort_values(by=year_col).reset_index(drop=True)
+
+    cols = numeric_columns(df, year_col)
+    filled = pd.Series(0, index=cols, dtype=int)
+    gaps = df[cols].isna().to_numpy().any(axis=0)
+    gap_cols = [col for col, gap in zip(cols, gaps) if gap]
+    if not gap_cols:
+        return Interpolation(df, filled)
+
+    # Blok (kolom x waktu): setiap kolom satu baris kontigu untuk akumulasi di sepanjang waktu
+    Y = np.array(df[gap_cols].to_numpy(dtype=float, na_value=np.nan).T, order="C")
+    nan = np.isnan(Y)
+    x = df[year_col].to_numpy(dtype=float)
+    n = Y.shape[1]
+
+    # Posisi data valid sebelum & sesudah setiap sel lewat akumulasi max/min
+    pos = np.arange(n, dtype=np.int32 if n < 2 ** 31 - 1 else np.int64)
+    prev = np.maximum.accumulate(np.where(nan, pos.dtype.type(-1), pos), axis=1)
+    nxt = np.minimum.accumulate(np.where(nan, pos.dtype.type(n), pos)[:, ::-1], axis=1)[:, ::-1]
+
+    fill = nan & (prev >= 0)
+    if limit is not None:
+        fill &= pos - prev <= limit
+    c, r = np.nonzero(fill)
+    p, q = prev[c, r], nxt[c, r]
+    values = Y[c, p]
+    inner = q < n
+    c_in, p_in, q_in = c[inner], p[inner], q[inner]
+    # Rumus sama dengan np.interp: slope * (x - x0) + y0
+    span = x[q_in] - x[p_in]
+    slope = np.divide(Y[c_in, q_in] - values[inner], span, out=np.zeros(len(span)), where=span != 0)
+    values[inner] = slope * (x[r[inner]] - x[p_in]) + values[inner]
+    Y[c, r] = values
+
+    # Susun ulang per dtype (float32 tetap float32); kolom tanpa NaN dibagi tanpa copy
+    dtypes = df[gap_cols].dtypes
+    parts = [df.drop(columns=gap_cols)]
+    for dtype in dtypes.unique():
+        idx = np.flatnonzero((dtypes == dtype).to_numpy())
+        values = Y[idx].T.astype(dtype if dtype.kind == 'f' else float, copy=False)
+        parts.append(pd.DataFrame(values, columns=[gap_cols[i] for i in idx]))
+    filled[gap_cols] = fill.sum(axis=1)
+    return Interpolation(pd.concat(parts, axis=1)[list(df.columns)], filled)
+
+
+def interpolate_numeric(df, year_col='Year', limit=None):
+    """Sort berdasarkan tahun lalu interpolasi linear semua kolom numerik (lihat `interpolate_frame`).
+
+    Mengembalikan DataFrame baru; `df` tidak diubah.
+    """
+    return interpolate_frame(df, year_col, limit).frame
+
+
+def _max_significant(values, digits):
+    # True jika setiap nilai finite bukan nol memuat maksimal `digits` digit signifikan desimal
+    # (mis. 59.2 atau 0.0123, bukan 13.4259437373017): nilai dibulatkan ke `digits` digit lalu
+    # dibandingkan persis. Pangkat 10 di luar 1e22 tidak eksak, jadi nilai seperti itu tidak lolos
+    x = values[np.isfinite(values) & (values != 0)]
+    if x.size == 0:
+        return True
+    exp = np.floor(np.log10(np.abs(x))).astype(int) - (digits - 1)
+    if np.abs(exp).max() > 22:
+        return False
+    up = 10.0 ** np.maximum(exp, 0)
+    down = 10.0 ** np.maximum(-exp, 0)
+    return np.array_equal(np.round(x / up * down) / down * up, x)
+
+
+def compact_frame(df, year_col='Year', digits=6):
+    """Versi hemat memori: kolom float64 jadi float32 dan tahun jadi int16 jika nilainya muat.
+
+    Kolom float hanya diturunkan jika semua nilainya memuat maksimal `digits`
+    digit signifikan (data tercatat seperti 59.2 atau 24.1) dan masuk rentang
+    float32. float32 menyimpan 6 digit desimal tanpa kehilangan, jadi nilai
+    asli selalu bisa dipulihkan; kolom hasil hitungan penuh presisi (mis.
+    13.4259437373017) tetap float64. Kolom lain dibagi dengan `df` tanpa copy
+    (Copy-on-Write).
+    """
+    if not 1 <= digits <= 6:
+        raise ValueError("digits harus 1..6 (presisi desimal float32)")
+    changes = {}
+    for col in df.select_dtypes(include='float64').columns:
+        values = df[col].to_numpy()
+        finite = values[np.isfinite(values)]
+        if finite.size and np.abs(finite).max() > np.finfo(np.float32).max:
+            continue
+        if _max_significant(values, digits):
+            changes[col] = values.astype(np.float32)
+
+    years = [col for col in df.columns if col.lower() == year_col.lower()]
+    for col in years:
+        values = df[col].to_numpy()
+        if (pd.api.types.is_numeric_dtype(values) and not np.isnan(values.astype(float)).any()
+                and np.array_equal(values, np.round(values))
+                and np.iinfo(np.int16).min <= values.min() and values.max() <= np.iinfo(np.int16).max):
+            changes[col] = values.astype(np.int16)
+
+    return df.assign(**changes) if changes else df
+
+
+def load_clean_data(path=DATASET_PATH, year_col='Year', use_cache=True, compact=False, limit=None):
+    """Load dataset lalu sort & interpolasi (data siap forecast); `compact` memakai `compact_frame`."""
+    df = load_dataset(path, use_cache)
+    if compact:
+        df = compact_frame(df, year_col)
+    return interpolate_numeric(df, year_col, limit)
+
+
+def profile_dataset(df):
+    """Hitung semua statistik eksplorasi sekali jalan (null dihitung satu kali untuk semua tabel)."""
+    nulls = df.isnull().sum()
+    info = pd.DataFrame({
+        "Column": df.columns,
+        "Data Type": df.dtypes.astype(str),
+        "Non-Null Count": len(df) - nulls,
+        "Null Count": nulls
+    })
+    missing = pd.DataFrame({
+        "Column": df.columns,
+        "Missing Count": nulls,
+        "Missing %": (nulls / len(df) * 100).round(2)
+    })
+    return DatasetProfile(df.shape[0], df.shape[1], nulls, int(nulls.sum()), info, missing, df.describe())
@@ -0,0 +1,93 @@
+from collections import namedtuple
+
+import numpy as np
+
+# Hasil Brown DES: setiap array berbentuk (jumlah alpha, n, ...)
+DESResult = namedtuple("DESResult", ["s1", "s2", "level", "trend", "forecast"])
+
+# Batas elemen (alpha x waktu x seri) per array saat grid alpha dievaluasi per blok (~32 MB float64)
+GRID_BLOCK_ELEMENTS = 1 << 22
+
+
+def alpha_blocks(alphas, n_elements):
+    """Potong grid alpha menjadi blok berisi maksimal GRID_BLOCK_ELEMENTS // `n_elements` alpha.
+
+    Seri pendek tetap satu blok (satu panggilan vektor); seri panjang atau
+    panel lebar dipecah sehingga memori O(blok x n), bukan O(grid x n).
+    """
+    size = max(1, GRID_BLOCK_ELEMENTS // max(n_elements, 1))
+    return [alphas[i:i + size] for i in range(0, len(alphas), size)]
+
+
+def _as_alphas(alphas):
+    alphas = np.atleast_1d(np.asarray(alphas, dtype=float))
+    if alphas.ndim != 1:
+        raise ValueError("alphas harus berupa skalar atau array 1-D")
+    return alphas
+
+
+def _exp_smooth(x, alphas):
+    """Single exponential smoothing S[t] = a*x[t] + (1-a)*S[t-1] dengan S[0] = x[0].
+
+    `x` berbentuk (k, n, ...) dengan satu baris per alpha. Rekursi dijalankan
+    sepanjang sumbu yang lebih pendek: per alpha lewat `lfilter` (loop waktu di C)
+    atau per waktu dengan seluruh alpha sekaligus sebagai satu operasi vektor.
+    """
+    k, n = x.shape[:2]
+    out = np.empty(x.shape)
+    out[:, 0] = x[:, 0]
+    if n < 2:
+        return out
+
+    if k <= n:
+        # Impor scipy.signal (~1 detik) ditunda sampai smoothing pertama, bukan saat package diimpor
+        from scipy.signal import lfilter
+        for i, alpha in enumerate(alphas):
+            zi = ((1 - alpha) * x[i, 0])[np.newaxis]
+            out[i, 1:], _ = lfilter([alpha], [1.0, -(1 - alpha)], x[i, 1:], axis=0, zi=zi)
+    else:
+        a = alphas.reshape((k,) + (1,) * (x.ndim - 2))
+        for t in range(1, n):
+            out[:, t] = a * x[:, t] + (1 - a) * out[:, t - 1]
+    return out
+
+
+def brown_des(y, alphas):
+    """Double Exponential Smoothing (Brown) untuk banyak alpha sekaligus.
+
+    `y` berupa deret 1-D (n,) atau panel (n, m) dengan waktu di sumbu pertama.
+    Hasilnya `DESResult` berisi S1, S2, level (a), trend (b) dan forecast
+    one-step-ahead, masing-masing berbentuk (len(alphas),) + y.shape.
+    `forecast[:, 0]` bernilai NaN karena belum ada forecast untuk t=0.
+    """
+    y = np.asarray(y, dtype=float)
+    if y.ndim not in (1, 2):
+        raise ValueError("y harus berupa array 1-D (n,) atau 2-D (n, m)")
+    alphas = _as_alphas(alphas)
+    k = len(alphas)
+    shape = (k,) + (1,) * y.ndim
+
+    s1 = _exp_smooth(np.broadcast_to(y, (k,) + y.shape), alphas)
+    s2 = _exp_smooth(s1, alphas)
+
+    # Komponen a & b (Brown); b = 0 jika alpha = 1
+    a = 2 * s1 - s2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(alphas != 1, alphas / (1 - alphas), 0.0).reshape(shape)
+    b = ratio * (s1 - s2)
+
+    # Forecast in-sample (one-step ahead): F[t] = a[t-1] + b[t-1]
+    forecast = np.full(a.shape, np.nan)
+    forecast[:, 1:] = a[:, :-1] + b[:, :-1]
+
+    return DESResult(s1, s2, a, b, forecast)
+
+
+def future_forecast(result, periods_ahead):
+    """Forecast m = 1..periods_ahead langkah ke depan: a[n-1] + b[n-1] * m.
+
+    Hasilnya berbentuk (k, periods_ahead, ...) mengikuti bentuk `result`.
+    """
+    level, trend = result.level[:, -1], result.trend[:, -1]
+    m = np.arange(1, periods_ahead + 1).reshape((-1,) + (1,) * (level.ndim - 1))
+    return level[:, np.newaxis] + trend[:, np.newaxis] * m
@@ -0,0 +1,104 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .metrics import METRICS, error_metrics
+
+# Hasil Holt: level, trend & forecast one-step berbentuk (K, n, ...), satu baris per kombinasi parameter
+HoltResult = namedtuple("HoltResult", ["level", "trend", "forecast", "alpha", "beta", "phi"])
+
+# Hasil grid search: kombinasi terbaik + permukaan error berbentuk (n_alpha, n_beta, n_phi)
+GridSearch = namedtuple("GridSearch", [
+    "method", "alpha", "beta", "phi", "score", "metric", "alphas", "betas", "phis", "scores",
+])
+
+METHODS = ("brown", "holt", "damped")
+
+
+def brown_params(alpha):
+    """Parameter Holt (alpha, beta, phi) yang ekuivalen dengan Brown DES satu parameter.
+
+    Brown dengan S1 = S2 = Y[0] sama dengan Holt dengan level awal Y[0], trend
+    awal 0, alpha_H = alpha(2 - alpha), beta_H = alpha / (2 - alpha) dan phi = 1.
+    """
+    alpha = np.asarray(alpha, dtype=float)
+    return alpha * (2 - alpha), alpha / (2 - alpha), np.ones_like(alpha)
+
+
+def holt_des(y, alphas, betas, phis=1.0):
+    """Holt linear / damped trend untuk banyak kombinasi parameter sekaligus.
+
+    `alphas`, `betas` dan `phis` di-broadcast menjadi K kombinasi; `y` berupa
+    deret (n,) atau panel (n, m). Level awal Y[0] dan trend awal 0 (sama dengan
+    inisialisasi Brown). Rekursi berjalan sepanjang waktu dengan seluruh
+    kombinasi parameter sebagai satu operasi vektor; `forecast[:, 0]` NaN.
+    """
+    y = np.asarray(y, dtype=float)
+    if y.ndim not in (1, 2):
+        raise ValueError("y harus berupa array 1-D (n,) atau 2-D (n, m)")
+    alphas, betas, phis = (np.ravel(p).astype(float) for p in np.broadcast_arrays(alphas, betas, phis))
+    K, n = len(alphas), len(y)
+    shape = (K,) + (1,) * (y.ndim - 1)
+    a, b, p = (param.reshape(shape) for param in (alphas, betas, phis))
+
+    level = np.empty((K,) + y.shape)
+    trend = np.empty((K,) + y.shape)
+    forecast = np.full((K,) + y.shape, np.nan)
+    level[:, 0] = y[0]
+    trend[:, 0] = 0.0
+    for t in range(1, n):
+        f = level[:, t - 1] + p * trend[:, t - 1]
+        forecast[:, t] = f
+        level[:, t] = a * y[t] + (1 - a) * f
+        trend[:, t] = b * (level[:, t] - level[:, t - 1]) + (1 - b) * p * trend[:, t - 1]
+
+    return HoltResult(level, trend, forecast, alphas, betas, phis)
+
+
+def damped_steps(phis, periods_ahead):
+    """Pengali trend phi + phi^2 + ... + phi^m untuk m = 1..periods_ahead, berbentuk (K, periods_ahead)."""
+    phis = np.atleast_1d(np.asarray(phis, dtype=float))[:, np.newaxis]
+    return np.cumsum(phis ** np.arange(1, periods_ahead + 1), axis=1)
+
+
+def holt_future(result, periods_ahead):
+    """Forecast m langkah ke depan: l[n-1] + (phi + ... + phi^m) * b[n-1], berbentuk (K, periods_ahead, ...)."""
+    level, trend = result.level[:, -1], result.trend[:, -1]
+    steps = damped_steps(result.phi, periods_ahead).reshape((len(result.phi), periods_ahead) + (1,) * (level.ndim - 1))
+    return level[:, np.newaxis] + trend[:, np.newaxis] * steps
+
+
+def grid_search(y, method="holt", metric="MSE", alphas=None, betas=None, phis=None):
+    """Cari parameter terbaik untuk Brown, Holt linear atau Holt damped dalam satu batch.
+
+    Seluruh grid alpha x beta x phi di-broadcast lalu dievaluasi dengan satu
+    panggilan `holt_des`. Brown hanya memakai grid alpha (dipetakan lewat
+    `brown_params`), Holt linear memakai phi = 1. `scores` berisi permukaan
+    setiap metrik berbentuk (len(alphas), len(betas), len(phis)).
+    """
+    if method not in METHODS:
+        raise ValueError(f"method harus salah satu dari {METHODS}")
+    if metric not in METRICS:
+        raise ValueError(f"metric harus salah satu dari {METRICS}")
+    y = np.asarray(y, dtype=float)
+
+    if method == "brown":
+        alphas = np.linspace(0.01, 0.99, 2000) if alphas is None else np.atleast_1d(alphas)
+        betas, phis = np.array([np.nan]), np.array([1.0])
+        result = holt_des(y, *brown_params(alphas))
+    else:
+        alphas = np.linspace(0.01, 0.99, 50) if alphas is None else np.atleast_1d(alphas)
+        betas = np.linspace(0.01, 0.99, 50) if betas is None else np.atleast_1d(betas)
+        if method == "holt":
+            phis = np.array([1.0])
+        else:
+            phis = np.linspace(0.80, 0.98, 10) if phis is None else np.atleast_1d(phis)
+        A, B, P = np.meshgrid(alphas, betas, phis, indexing="ij")
+        result = holt_des(y, A, B, P)
+
+    shape = (len(alphas), len(betas), len(phis))
+    scores = {name: values.reshape(shape) for name, values in error_metrics(y, result.forecast).items()}
+    i, j, k = np.unravel_index(int(np.nanargmin(scores[metric])), shape)
+
+    return GridSearch(method, float(alphas[i]), None if method == "brown" else float(betas[j]), float(phis[k]),
+                      float(scores[metric][i, j, k]), metric, alphas, betas, phis, scores)
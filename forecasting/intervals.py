@@ -0,0 +1,45 @@
+import numpy as np
+
+
+def simulate_paths(level, trend, alpha, beta, phi, residuals, periods_ahead, n_paths=10000, seed=None):
+    """Simulasi jalur DES ke depan (bentuk Holt) dengan bootstrap residual.
+
+    Mulai dari level/trend observasi terakhir, setiap langkah mengambil
+    residual acak (dengan pengembalian) dari `residuals`, menambahkannya ke
+    forecast one-step, lalu meng-update level/trend dengan nilai simulasi
+    tersebut. Brown DES disimulasikan lewat parameter `brown_params(alpha)`.
+    Semua jalur dihitung sekaligus; loop hanya sepanjang horizon.
+    Hasilnya array (n_paths, periods_ahead).
+    """
+    residuals = np.asarray(residuals, dtype=float)
+    residuals = residuals[~np.isnan(residuals)]
+    if len(residuals) == 0:
+        raise ValueError("Minimal satu residual diperlukan untuk bootstrap")
+    alpha, beta, phi = float(alpha), float(beta), float(phi)
+
+    rng = np.random.default_rng(seed)
+    shocks = rng.choice(residuals, size=(n_paths, periods_ahead))
+
+    paths = np.empty((n_paths, periods_ahead))
+    L = np.full(n_paths, float(level))
+    B = np.full(n_paths, float(trend))
+    for m in range(periods_ahead):
+        forecast = L + phi * B
+        paths[:, m] = forecast + shocks[:, m]
+        L_new = alpha * paths[:, m] + (1 - alpha) * forecast
+        B = beta * (L_new - L) + (1 - beta) * phi * B
+        L = L_new
+    return paths
+
+
+def prediction_intervals(paths, levels=(80, 95)):
+    """Batas bawah/atas per horizon untuk setiap level (%) dari jalur simulasi.
+
+    Hasilnya dict level -> (lower, upper), masing-masing array (periods_ahead,).
+    """
+    intervals = {}
+    for level in levels:
+        tail = (100 - level) / 2
+        lower, upper = np.percentile(paths, [tail, 100 - tail], axis=0)
+        intervals[level] = (lower, upper)
+    return intervals
@@ -0,0 +1,86 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .backtest import rolling_backtest
+from .des import brown_des, future_forecast
+from .holt import brown_params
+from .intervals import prediction_intervals, simulate_paths
+from .metrics import error_metrics
+from .series import SeriesForecast
+
+# Posisi slider alpha di halaman utama (0.01..0.99, langkah 0.01)
+ALPHA_GRID = np.round(np.arange(1, 100) / 100, 2)
+
+# Hasil Brown DES untuk setiap alpha di grid, diindeks baris alpha:
+# des: DESResult (k, n); metrics: dict metrik -> (k,); future: (k, max_periods);
+# intervals: dict level -> array (2, k, max_periods) [bawah, atas];
+# backtest: tabel rolling_backtest untuk horizon 1..max_periods (None jika data terlalu pendek)
+BrownGrid = namedtuple("BrownGrid", ["alphas", "years", "actual", "des", "metrics", "future", "max_periods",
+                                     "intervals", "backtest"])
+
+
+def precompute_brown(years, y, alphas=ALPHA_GRID, max_periods=20, levels=(80, 95), n_paths=10000, seed=0,
+                     min_train=4):
+    """Hitung sekali semua hasil Brown DES untuk grid alpha sampai `max_periods` langkah ke depan.
+
+    Smoothing, metrik, prediksi dan backtest untuk seluruh grid dihitung dalam
+    satu panggilan vektor masing-masing; interval prediksi disimulasikan per
+    alpha untuk horizon terpanjang, sehingga horizon yang lebih pendek cukup
+    dipotong (batas horizon 1..h tidak berubah saat h diperpanjang).
+    """
+    y = np.asarray(y, dtype=float)
+    years = np.asarray(years).astype(int)
+    alphas = np.asarray(alphas, dtype=float)
+
+    des = brown_des(y, alphas)
+    future = future_forecast(des, max_periods)
+    metrics = error_metrics(y, des.forecast)
+
+    intervals = {level: np.empty((2, len(alphas), max_periods)) for level in levels}
+    errors = y - des.forecast
+    for i, alpha in enumerate(alphas):
+        paths = simulate_paths(des.level[i, -1], des.trend[i, -1], *brown_params(alpha), errors[i], max_periods,
+                               n_paths, seed=seed)
+        for level, (lower, upper) in prediction_intervals(paths, levels).items():
+            intervals[level][:, i] = lower, upper
+
+    max_horizon = min(max_periods, len(y) - min_train)
+    backtest = None
+    if max_horizon >= 1:
+        backtest = rolling_backtest(y, alphas, range(1, max_horizon + 1), min_train=min_train)
+
+    return BrownGrid(alphas, years, y, des, metrics, future, max_periods, intervals, backtest)
+
+
+def grid_index(grid, alpha):
+    """Baris grid untuk `alpha`, atau None jika alpha tidak ada di grid (toleransi 1e-9)."""
+    i = int(np.argmin(np.abs(grid.alphas - alpha)))
+    return i if abs(grid.alphas[i] - alpha) <= 1e-9 else None
+
+
+def grid_forecast(grid, alpha, periods_ahead):
+    """Ambil hasil satu alpha dari grid: (SeriesForecast, intervals, backtest) tanpa menghitung ulang DES.
+
+    `intervals` berbentuk dict level -> (lower, upper) seperti `prediction_intervals`
+    dan `backtest` hanya berisi horizon 1..periods_ahead. KeyError jika alpha
+    tidak ada di grid atau periods_ahead melebihi `max_periods`.
+    """
+    i = grid_index(grid, alpha)
+    if i is None or not 1 <= periods_ahead <= grid.max_periods:
+        raise KeyError((alpha, periods_ahead))
+
+    des = grid.des
+    res = SeriesForecast(
+        "brown", float(grid.alphas[i]), None, 1.0, grid.years, grid.actual, des.s1[i], des.s2[i], des.level[i],
+        des.trend[i], des.forecast[i], grid.actual - des.forecast[i],
+        {name: float(values[i]) for name, values in grid.metrics.items()},
+        grid.years[-1] + np.arange(1, periods_ahead + 1), grid.future[i, :periods_ahead])
+    intervals = {level: (bounds[0, i, :periods_ahead], bounds[1, i, :periods_ahead])
+                 for level, bounds in grid.intervals.items()}
+
+    backtest = None
+    if grid.backtest is not None:
+        rows = grid.backtest[(grid.backtest["alpha"] == grid.alphas[i]) & (grid.backtest["horizon"] <= periods_ahead)]
+        backtest = rows.reset_index(drop=True)
+    return res, intervals, backtest
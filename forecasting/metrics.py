@@ -0,0 +1,35 @@
+import numpy as np
+
+METRICS = ("MAE", "MSE", "RMSE", "MAPE")
+
+
+def error_metrics(y, forecast):
+    """MAE, MSE, RMSE dan MAPE (%) untuk setiap baris `forecast`.
+
+    `y` berbentuk (n, ...) dan `forecast` berbentuk (k, n, ...), misalnya hasil
+    `brown_des`. Titik dengan forecast NaN (t=0) diabaikan, dan MAPE hanya
+    memakai titik dengan Y != 0, dibagi |Y| (tetap positif untuk seri
+    bernilai negatif). Metrik tanpa titik valid bernilai 0.
+    Hasilnya dict nama metrik -> array berbentuk (k, ...).
+    """
+    y = np.asarray(y, dtype=float)
+    forecast = np.asarray(forecast, dtype=float)
+    if forecast.ndim == y.ndim:
+        forecast = forecast[np.newaxis]
+
+    error = y - forecast
+    valid = ~np.isnan(error)
+    nonzero = valid & (y != 0)
+    abs_error = np.where(valid, np.abs(error), 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        count = valid.sum(axis=1)
+        mae = abs_error.sum(axis=1) / count
+        mse = np.square(abs_error).sum(axis=1) / count
+        ape = np.where(nonzero, abs_error / np.where(nonzero, np.abs(y), 1.0), 0.0)
+        mape = ape.sum(axis=1) / nonzero.sum(axis=1) * 100
+
+    mae = np.where(count > 0, mae, 0.0)
+    mse = np.where(count > 0, mse, 0.0)
+    mape = np.nan_to_num(mape, nan=0.0)
+    return {"MAE": mae, "MSE": mse, "RMSE": np.sqrt(mse), "MAPE": mape}
@@ -0,0 +1,43 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .des import alpha_blocks, brown_des
+from .metrics import METRICS, error_metrics
+
+# Hasil pencarian alpha: optimum hasil refine + kurva error di seluruh grid
+AlphaSearch = namedtuple("AlphaSearch", ["alpha", "score", "metric", "grid", "scores"])
+
+
+def optimize_alpha(y, metric="MSE", bounds=(0.01, 0.99), grid_size=2000):
+    """Cari alpha Brown DES yang meminimalkan `metric` pada forecast in-sample.
+
+    Grid alpha dievaluasi per blok (`alpha_blocks`) dan hanya kurva metrik
+    per alpha yang disimpan, sehingga memori O(blok x n). Minimum grid
+    di-refine dengan optimizer 1-D bounded di antara dua titik grid
+    tetangganya. `scores` berisi kurva setiap metrik terhadap `grid`.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"metric harus salah satu dari {METRICS}")
+    y = np.asarray(y, dtype=float)
+    lo, hi = bounds
+
+    grid = np.linspace(lo, hi, grid_size)
+    blocks = [error_metrics(y, brown_des(y, block).forecast) for block in alpha_blocks(grid, y.size)]
+    scores = {name: np.concatenate([b[name] for b in blocks]) for name in METRICS}
+    curve = scores[metric]
+
+    best = int(np.nanargmin(curve))
+    alpha, score = float(grid[best]), float(curve[best])
+
+    def objective(a):
+        return float(error_metrics(y, brown_des(y, a).forecast)[metric][0])
+
+    left, right = grid[max(best - 1, 0)], grid[min(best + 1, grid_size - 1)]
+    if right > left:
+        from scipy.optimize import minimize_scalar
+        res = minimize_scalar(objective, bounds=(left, right), method="bounded")
+        if res.success and res.fun < score:
+            alpha, score = float(res.x), float(res.fun)
+
+    return AlphaSearch(alpha, score, metric, grid, scores)
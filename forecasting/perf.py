@@ -0,0 +1,132 @@
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+# DES_PERF: "off" (default), "time" (wall time per tahap) atau "memory" (+ peak memori via tracemalloc)
+PERF_MODE = os.environ.get("DES_PERF", "off").lower()
+if PERF_MODE in ("1", "on", "true"):
+    PERF_MODE = "time"
+ENABLED = PERF_MODE in ("time", "memory")
+TRACE_MEMORY = PERF_MODE == "memory"
+# Jika diisi, setiap run ditambahkan ke file ini sebagai satu baris JSON
+PERF_LOG = os.environ.get("DES_PERF_LOG")
+
+# Awal proses (import pertama package ini), dasar laporan time-to-first-render
+BOOT_TIME = time.perf_counter()
+
+_NULL = contextlib.nullcontext()
+_local = threading.local()
+_rendered = set()
+_rendered_lock = threading.Lock()
+
+
+class PerfRecorder:
+    """Pencatat wall time (dan opsional peak memori) per tahap dalam satu run.
+
+    Tahap boleh bersarang; setiap record menyimpan `path` ("forecast/smoothing"),
+    `depth`, `start_s` relatif terhadap awal run, `seconds` dan `peak_bytes`
+    (alokasi puncak di atas memori saat tahap dimulai, None tanpa tracemalloc).
+    """
+
+    def __init__(self, run, trace_memory=TRACE_MEMORY):
+        self.run = run
+        self.trace_memory = trace_memory
+        self.timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.records = []
+        self._stack = []
+        self._t0 = time.perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        frame = {"name": name, "peak": 0, "mem0": 0}
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # Peak tahap induk disimpan dulu sebelum counter peak direset untuk tahap ini
+            if self._stack:
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            tracemalloc.reset_peak()
+            frame["mem0"] = current
+        path = "/".join([f["name"] for f in self._stack] + [name])
+        depth = len(self._stack)
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self._stack.pop()
+            peak_bytes = None
+            if self.trace_memory:
+                frame["peak"] = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+                if self._stack:
+                    self._stack[-1]["peak"] = max(self._stack[-1]["peak"], frame["peak"])
+                peak_bytes = max(frame["peak"] - frame["mem0"], 0)
+            self.records.append({"stage": name, "path": path, "depth": depth,
+                                 "start_s": start - self._t0, "seconds": seconds, "peak_bytes": peak_bytes})
+
+    def total_seconds(self):
+        return time.perf_counter() - self._t0
+
+    def to_dict(self):
+        # Urutkan menurut waktu mulai supaya tahap induk tampil sebelum anak-anaknya
+        return {"run": self.run, "timestamp": self.timestamp, "total_s": self.total_seconds(),
+                "trace_memory": self.trace_memory,
+                "stages": sorted(self.records, key=lambda r: (r["start_s"], r["depth"]))}
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+def start_run(run):
+    """Mulai pencatatan untuk run ini di thread aktif; None (tanpa biaya) jika DES_PERF mati."""
+    if not ENABLED:
+        return None
+    _local.recorder = PerfRecorder(run)
+    return _local.recorder
+
+
+def finish_run(recorder):
+    """Akhiri run: lepas dari thread aktif dan tulis ke DES_PERF_LOG (JSON lines) jika diset."""
+    if recorder is None:
+        return None
+    if getattr(_local, "recorder", None) is recorder:
+        _local.recorder = None
+    data = recorder.to_dict()
+    if PERF_LOG:
+        with open(PERF_LOG, "a", encoding="utf-8") as f:
+            f.write(json.dumps(data) + "\n")
+    return data
+
+
+def first_render(page, run_seconds):
+    """Laporkan run pertama `page` di proses ini: durasi run dan waktu sejak BOOT_TIME.
+
+    Laporan dicetak ke log server dan ditambahkan ke DES_PERF_LOG (jika diset);
+    run berikutnya dari halaman yang sama mengembalikan None tanpa mencatat apa pun.
+    """
+    with _rendered_lock:
+        if page in _rendered:
+            return None
+        _rendered.add(page)
+    data = {"run": page, "event": "first_render",
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "run_s": run_seconds, "since_boot_s": time.perf_counter() - BOOT_TIME}
+    print(f"First render {page}: {run_seconds * 1e3:,.0f} ms ({data['since_boot_s']:.2f} s sejak boot)", flush=True)
+    if PERF_LOG:
+        with open(PERF_LOG, "a", encoding="utf-8") as f:
+            f.write(json.dumps(data) + "\n")
+    return data
+
+
+def stage(name):
+    """Context manager pencatat satu tahap; no-op jika pencatatan mati atau tidak ada run aktif."""
+    if not ENABLED:
+        return _NULL
+    recorder = getattr(_local, "recorder", None)
+    return _NULL if recorder is None else recorder.stage(name)
@@ -0,0 +1,76 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .des import brown_des, future_forecast
+from .holt import METHODS, holt_des, holt_future
+from .metrics import error_metrics
+
+# Hasil forecast satu seri: komponen DES, error, metrik dan prediksi ke depan.
+# s1/s2 hanya ada untuk Brown; level/trend adalah a/b (Brown) atau l/b (Holt).
+SeriesForecast = namedtuple("SeriesForecast", [
+    "method", "alpha", "beta", "phi", "years", "actual", "s1", "s2", "level", "trend", "forecast", "error",
+    "metrics", "future_years", "future",
+])
+
+
+def forecast_series(years, y, alpha, periods_ahead, method="brown", beta=None, phi=1.0):
+    """DES untuk satu seri dengan satu set parameter, lengkap dengan metrik & prediksi.
+
+    `method` adalah "brown" (hanya alpha), "holt" (alpha, beta) atau "damped"
+    (alpha, beta, phi). `error[0]` dan `forecast[0]` bernilai NaN (belum ada
+    forecast untuk t=0); `metrics` berupa dict MAE/MSE/RMSE/MAPE bertipe float.
+    """
+    if method not in METHODS:
+        raise ValueError(f"method harus salah satu dari {METHODS}")
+    y = np.asarray(y, dtype=float)
+    years = np.asarray(years).astype(int)
+
+    if method == "brown":
+        beta, phi = None, 1.0
+        des = brown_des(y, alpha)
+        S1, S2, a, b, forecast = (arr[0] for arr in des)
+        future = future_forecast(des, periods_ahead)[0]
+        all_forecasts = des.forecast
+    else:
+        if beta is None:
+            raise ValueError("beta wajib diisi untuk metode Holt")
+        phi = 1.0 if method == "holt" else float(phi)
+        holt = holt_des(y, alpha, beta, phi)
+        S1 = S2 = None
+        a, b, forecast = holt.level[0], holt.trend[0], holt.forecast[0]
+        future = holt_future(holt, periods_ahead)[0]
+        all_forecasts = holt.forecast
+        beta = float(beta)
+
+    metrics = {name: float(values[0]) for name, values in error_metrics(y, all_forecasts).items()}
+
+    # Forecasting m steps ahead menggunakan level & trend terakhir
+    future_years = years[-1] + np.arange(1, periods_ahead + 1)
+
+    return SeriesForecast(method, float(alpha), beta, phi, years, y, S1, S2, a, b, forecast, y - forecast,
+                          metrics, future_years, future)
+
+
+def forecast_table(res):
+    """Tabel perhitungan lengkap bertipe numerik langsung dari array hasil `forecast_series`.
+
+    Kolom S1/S2 hanya ada untuk Brown; nilai baris pertama Forecast/Error NaN.
+    """
+    columns = {
+        "No": np.arange(1, len(res.years) + 1),
+        "Tahun": res.years,
+        "Gini Aktual": res.actual,
+    }
+    if res.s1 is not None:
+        columns.update({"S1": res.s1, "S2": res.s2})
+    columns.update({
+        "a": res.level,
+        "b": res.trend,
+        "Forecast": res.forecast,
+        "Error": res.error,
+        "|Error|": np.abs(res.error),
+        "Error²": np.square(res.error),
+    })
+    return pd.DataFrame(columns)
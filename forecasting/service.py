@@ -0,0 +1,328 @@
+"""Service HTTP lokal untuk forecast Brown DES dengan penggabungan request (batching).
+
+Jalankan:
+    python -m forecasting.service --port 8765 --dataset sa="Income Inequality in South Africa_Dataset.xlsx"
+
+Endpoint:
+    POST /forecast  {"dataset": "default", "series": "gini_disp", "alpha": 0.6, "periods": 5}
+                    atau {"values": [...], "years": [...], "alpha": null, "metric": "MSE"}
+                    atau list berisi objek-objek di atas
+    GET  /datasets  daftar dataset dan seri numeriknya
+    GET  /stats     jumlah request, batch dan rata-rata ukuran batch
+    GET  /health
+
+Dari Python: `from forecasting.service import ForecastService, make_server`
+(sengaja tidak diekspor dari package supaya `python -m forecasting.service`
+tidak memuat modul ini dua kali).
+"""
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from .data import DATASET_PATH, TARGET_COL, load_clean_data, numeric_columns
+from .des import brown_des, future_forecast
+from .memo import LRUCache
+from .metrics import METRICS, error_metrics
+from .optimize import optimize_alpha
+
+# Satu request forecast yang sudah divalidasi; `key` mengelompokkan request dengan seri yang sama
+ForecastRequest = namedtuple("ForecastRequest", ["key", "years", "y", "alpha", "periods", "metric"])
+
+MAX_PERIODS = 100
+# Batas input per request supaya satu caller tidak bisa menghabiskan memori/CPU proses service
+MAX_VALUES = 10_000
+MAX_BODY_BYTES = 1 << 20
+
+
+class RequestBatcher:
+    """Kumpulkan request yang datang dalam jendela `window` detik lalu proses sekaligus.
+
+    `compute(items)` dipanggil di satu thread worker dengan list item dan harus
+    mengembalikan list hasil (atau Exception) dengan urutan yang sama.
+    """
+
+    def __init__(self, compute, window=0.002, max_batch=512):
+        self.compute = compute
+        self.window = window
+        self.max_batch = max_batch
+        self.requests = 0
+        self.batches = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="forecast-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            self.requests += len(batch)
+            self.batches += 1
+            try:
+                results = self.compute([item for item, _ in batch])
+            except Exception as exc:
+                results = [exc] * len(batch)
+            for (_, future), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def stats(self):
+        return {"requests": self.requests, "batches": self.batches,
+                "mean_batch_size": self.requests / self.batches if self.batches else 0.0}
+
+
+def compute_batch(requests):
+    """Forecast sekumpulan request: request dengan seri yang sama dihitung dalam satu `brown_des`.
+
+    Semua alpha untuk satu seri dievaluasi sebagai satu vektor, dan prediksi
+    dihitung sampai horizon terpanjang lalu dipotong per request.
+    """
+    results = [None] * len(requests)
+    groups = {}
+    for i, req in enumerate(requests):
+        groups.setdefault(req.key, []).append(i)
+
+    for indices in groups.values():
+        first = requests[indices[0]]
+        alphas = np.array([requests[i].alpha for i in indices], dtype=float)
+        unique, inverse = np.unique(alphas, return_inverse=True)
+        des = brown_des(first.y, unique)
+        future = future_forecast(des, max(requests[i].periods for i in indices))
+        scores = error_metrics(first.y, des.forecast)
+
+        last_year = int(first.years[-1])
+        for i, row in zip(indices, inverse):
+            req = requests[i]
+            results[i] = {
+                "alpha": float(unique[row]),
+                "years": first.years.tolist(),
+                "forecast": _floats(des.forecast[row]),
+                "future_years": list(range(last_year + 1, last_year + req.periods + 1)),
+                "future": _floats(future[row, :req.periods]),
+                "metrics": dict(zip(scores, _floats([values[row] for values in scores.values()]))),
+            }
+    return results
+
+
+def _floats(values):
+    # JSON tidak punya NaN/Infinity: forecast[0] (belum ada forecast) dan overflow dikirim sebagai null
+    return [float(v) if np.isfinite(v) else None for v in values]
+
+
+def _series_arrays(df, series):
+    data = df[["Year", series]].dropna()
+    return data["Year"].to_numpy().astype(int), data[series].to_numpy(dtype=float)
+
+
+class ForecastService:
+    """Mesin forecast di belakang HTTP: dataset bersih disimpan hangat di memori, request di-batch.
+
+    `datasets` memetakan id -> path. Dataset dibaca + diinterpolasi sekali dan
+    dibaca ulang hanya jika ukuran/mtime file berubah. Alpha optimal (alpha
+    None) di-cache per (dataset, versi, seri, metrik), array seri per (dataset,
+    versi, seri).
+    """
+
+    def __init__(self, datasets=None, window=0.002, max_batch=512):
+        self.datasets = dict(datasets or {"default": DATASET_PATH})
+        self._frames = {}
+        self._lock = threading.Lock()
+        self._series = LRUCache(maxsize=256)
+        self._alphas = LRUCache(maxsize=1024)
+        self.batcher = RequestBatcher(compute_batch, window, max_batch)
+
+    def frame(self, dataset):
+        if dataset not in self.datasets:
+            raise ValueError(f"Dataset tidak dikenal: {dataset!r}")
+        path = self.datasets[dataset]
+        st_ = os.stat(path)
+        version = (st_.st_size, st_.st_mtime_ns)
+        with self._lock:
+            cached = self._frames.get(dataset)
+            if cached is None or cached[0] != version:
+                cached = (version, load_clean_data(path))
+                self._frames[dataset] = cached
+        return cached
+
+    def warm(self):
+        # Muat semua dataset di awal supaya request pertama tidak menanggung parsing
+        for dataset in self.datasets:
+            self.frame(dataset)
+
+    def list_datasets(self):
+        return {name: numeric_columns(self.frame(name)[1]) for name in self.datasets}
+
+    def parse(self, body):
+        """Validasi satu objek request JSON menjadi ForecastRequest (ValueError jika tidak valid)."""
+        if not isinstance(body, dict):
+            raise ValueError("Request harus berupa objek JSON")
+        periods = int(body.get("periods", 5))
+        if not 1 <= periods <= MAX_PERIODS:
+            raise ValueError(f"periods harus 1..{MAX_PERIODS}")
+        metric = body.get("metric", "MSE")
+        if metric not in METRICS:
+            raise ValueError(f"metric harus salah satu dari {METRICS}")
+
+        if "values" in body:
+            y = np.asarray(body["values"], dtype=float)
+            if y.ndim != 1 or not np.isfinite(y).all():
+                raise ValueError("values harus list angka finite tanpa null")
+            if len(y) > MAX_VALUES:
+                raise ValueError(f"values maksimal {MAX_VALUES} titik")
+            years = np.asarray(body.get("years", range(len(y))), dtype=int)
+            if len(years) != len(y):
+                raise ValueError("Panjang years dan values harus sama")
+            key = ("values", y.tobytes(), years.tobytes())
+        else:
+            dataset = body.get("dataset", "default")
+            series = body.get("series", TARGET_COL)
+            version, df = self.frame(dataset)
+            if series not in df.columns or series == "Year":
+                raise ValueError(f"Seri tidak ada di dataset {dataset!r}: {series!r}")
+            key = (dataset, version, series)
+            years, y = self._series.get_or_compute(key, lambda: _series_arrays(df, series))
+        if len(y) < 4:
+            raise ValueError("Minimal 4 data diperlukan untuk Double Exponential Smoothing")
+
+        alpha = body.get("alpha")
+        if alpha is None:
+            alpha = self._alphas.get_or_compute(key + (metric,), lambda: optimize_alpha(y, metric=metric).alpha)
+        alpha = float(alpha)
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha harus di rentang (0, 1]")
+        return ForecastRequest(key, years, y, alpha, periods, metric)
+
+    def forecast(self, bodies):
+        """Forecast list objek request; semua dikirim ke batcher dulu baru ditunggu."""
+        futures = [self.batcher.submit(self.parse(body)) for body in bodies]
+        return [future.result() for future in futures]
+
+    def stats(self):
+        return {**self.batcher.stats(), "alpha_cache": self._alphas.stats()}
+
+
+# ====================== HTTP ======================
+class _Handler(BaseHTTPRequestHandler):
+    service = None
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok"})
+        elif self.path == "/datasets":
+            try:
+                datasets = self.service.list_datasets()
+            except Exception as exc:
+                self._send(500, {"error": f"{type(exc).__name__}: {exc}"})
+                return
+            self._send(200, datasets)
+        elif self.path == "/stats":
+            self._send(200, self.service.stats())
+        else:
+            self._send(404, {"error": f"Path tidak dikenal: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/forecast":
+            self._send(404, {"error": f"Path tidak dikenal: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            self._send(400, {"error": "Content-Length tidak valid"})
+            return
+        if not 0 <= length <= MAX_BODY_BYTES:
+            # Body tidak dibaca: koneksi ditutup supaya sisa body tidak terbaca sebagai request berikutnya
+            self.close_connection = True
+            self._send(413, {"error": f"Body request maksimal {MAX_BODY_BYTES} byte"})
+            return
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+            results = self.service.forecast(body if isinstance(body, list) else [body])
+        except (ValueError, TypeError, OverflowError) as exc:
+            self._send(400, {"error": str(exc)})
+            return
+        except Exception as exc:
+            # Error server (mis. file dataset hilang) tetap dibalas, bukan koneksi diputus tanpa respons
+            self._send(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+        self._send(200, results if isinstance(body, list) else results[0])
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    # Backlog default socketserver (5) me-reset koneksi saat banyak caller datang bersamaan
+    request_queue_size = 256
+
+
+def make_server(service, host="127.0.0.1", port=8765):
+    """ThreadingHTTPServer yang meneruskan request ke `service` (satu thread per koneksi)."""
+    handler = type("ForecastHandler", (_Handler,), {"service": service})
+    return _Server((host, port), handler)
+
+
+def _dataset(value):
+    name, sep, path = value.partition("=")
+    if not sep or not name or not path:
+        raise argparse.ArgumentTypeError("format dataset: nama=path")
+    return name, path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m forecasting.service",
+                                     description="Service HTTP lokal untuk forecast Brown DES.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--dataset", type=_dataset, action="append", default=[],
+                        help="Dataset tambahan nama=path (default: dataset Gini sebagai 'default')")
+    parser.add_argument("--window-ms", type=float, default=2.0,
+                        help="Jendela penggabungan request menjadi satu batch (milidetik)")
+    args = parser.parse_args(argv)
+
+    service = ForecastService({"default": DATASET_PATH, **dict(args.dataset)}, window=args.window_ms / 1000)
+    service.warm()
+    server = make_server(service, args.host, args.port)
+    print(f"Forecast service di http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,100 @@
+import math
+
+import numpy as np
+
+from .des import brown_des
+
+
+class DESState:
+    """State Brown DES yang bisa di-update per observasi baru dalam O(1).
+
+    Menyimpan S1, S2, level (a), trend (b) dari observasi terakhir beserta
+    akumulator error one-step-ahead, sehingga forecast dan metrik bisa
+    diperbarui tanpa memproses ulang histori. Rekursinya identik dengan
+    `brown_des`: state hasil `from_series(y[:k]).extend(y[k:])` sama persis
+    dengan `from_series(y)`.
+    """
+
+    _FIELDS = ("alpha", "s1", "s2", "n", "sum_abs", "sum_sq", "sum_ape", "n_ape")
+
+    def __init__(self, alpha, s1, s2, n=1, sum_abs=0.0, sum_sq=0.0, sum_ape=0.0, n_ape=0):
+        self.alpha = float(alpha)
+        self.s1 = float(s1)
+        self.s2 = float(s2)
+        self.n = int(n)
+        self.sum_abs = float(sum_abs)
+        self.sum_sq = float(sum_sq)
+        self.sum_ape = float(sum_ape)
+        self.n_ape = int(n_ape)
+
+    @classmethod
+    def from_series(cls, y, alpha):
+        """Inisialisasi state dari histori lengkap (sekali, O(n))."""
+        y = np.asarray(y, dtype=float)
+        if len(y) == 0:
+            raise ValueError("y minimal berisi 1 observasi")
+        des = brown_des(y, alpha)
+        error = (y - des.forecast[0])[1:]
+        nonzero = y[1:] != 0
+        return cls(alpha, des.s1[0, -1], des.s2[0, -1], len(y),
+                   np.abs(error).sum(), np.square(error).sum(),
+                   (np.abs(error[nonzero]) / np.abs(y[1:][nonzero])).sum(), nonzero.sum())
+
+    @property
+    def level(self):
+        return 2 * self.s1 - self.s2
+
+    @property
+    def trend(self):
+        alpha = self.alpha
+        return (alpha / (1 - alpha)) * (self.s1 - self.s2) if (1 - alpha) != 0 else 0.0
+
+    def update(self, y):
+        """Tambahkan satu observasi baru; kembalikan forecast untuk periode berikutnya."""
+        y = float(y)
+        if not math.isfinite(y):
+            raise ValueError("Observasi harus berupa angka finite")
+
+        # Error one-step-ahead terhadap forecast dari state sebelumnya
+        error = y - (self.level + self.trend)
+        self.sum_abs += abs(error)
+        self.sum_sq += error ** 2
+        if y != 0:
+            self.sum_ape += abs(error) / abs(y)
+            self.n_ape += 1
+
+        alpha = self.alpha
+        self.s1 = alpha * y + (1 - alpha) * self.s1
+        self.s2 = alpha * self.s1 + (1 - alpha) * self.s2
+        self.n += 1
+        return self.level + self.trend
+
+    def extend(self, values):
+        """Update berurutan untuk banyak observasi; kembalikan forecast terakhir."""
+        forecast = self.level + self.trend
+        for y in values:
+            forecast = self.update(y)
+        return forecast
+
+    def forecast(self, periods_ahead):
+        """Forecast m = 1..periods_ahead langkah ke depan dari observasi terakhir."""
+        return self.level + self.trend * np.arange(1, periods_ahead + 1)
+
+    def metrics(self):
+        """MAE, MSE, RMSE dan MAPE (%) dari error one-step-ahead sejauh ini."""
+        count = self.n - 1
+        mae = self.sum_abs / count if count > 0 else 0.0
+        mse = self.sum_sq / count if count > 0 else 0.0
+        mape = self.sum_ape / self.n_ape * 100 if self.n_ape > 0 else 0.0
+        return {"MAE": mae, "MSE": mse, "RMSE": math.sqrt(mse), "MAPE": mape}
+
+    def to_dict(self):
+        """State sebagai dict JSON-serializable untuk disimpan."""
+        return {field: getattr(self, field) for field in self._FIELDS}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{field: data[field] for field in cls._FIELDS})
+
+    def __repr__(self):
+        return f"DESState(alpha={self.alpha}, n={self.n}, level={self.level:.6g}, trend={self.trend:.6g})"
@@ -0,0 +1,297 @@
+import math
+import os
+import tempfile
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .batch import forecast_panel
+from .data import interpolate_numeric, numeric_columns
+
+# Ringkasan run streaming: jumlah entitas diproses/dilewati, baris input dan file output
+StreamSummary = namedtuple("StreamSummary", ["entities", "skipped", "rows", "forecasts_path", "metrics_path"])
+
+
+# ====================== BACA PER CHUNK ======================
+def iter_chunks(path, columns=None, chunksize=100_000, text_columns=()):
+    """Baca CSV/Parquet sebagai rangkaian DataFrame berisi maksimal `chunksize` baris.
+
+    Kolom di `text_columns` selalu dibaca sebagai teks. Tanpa itu id numerik
+    terbaca int64 di satu chunk dan float64 di chunk yang memuat sel kosong.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize,
+                               dtype={col: str for col in text_columns} or None)
+    elif ext == ".parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            for col in text_columns:
+                i = batch.schema.get_field_index(col)
+                batch = batch.set_column(i, col, batch.column(i).cast(pa.string()))
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Streaming hanya mendukung CSV atau Parquet: {path}")
+
+
+def estimate_rows(path, sample_bytes=1 << 20):
+    """Perkiraan jumlah baris: metadata Parquet, atau kepadatan baris di 1 MiB pertama CSV."""
+    if os.path.splitext(path)[1].lower() == ".parquet":
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+    with open(path, "rb") as f:
+        sample = f.read(sample_bytes)
+    if not sample:
+        return 0
+    return int(os.path.getsize(path) / len(sample) * max(sample.count(b"\n"), 1))
+
+
+def iter_entities(chunks, entity_col):
+    """Kelompokkan chunk menjadi (entitas, DataFrame) untuk data yang baris entitasnya berurutan.
+
+    Kelompok terakhir tiap chunk ditahan sampai chunk berikutnya karena bisa
+    berlanjut, sehingga memori dibatasi chunk + satu entitas. Entitas yang
+    muncul lagi setelah kelompoknya selesai memicu ValueError (pakai
+    `iter_partitions` untuk data yang tidak terurut).
+    """
+    seen = set()
+    carry = None
+    for chunk in chunks:
+        chunk = chunk[chunk[entity_col].notna()]
+        if carry is not None:
+            chunk = pd.concat([carry, chunk], ignore_index=True)
+        if chunk.empty:
+            continue
+        keys = chunk[entity_col]
+        starts = np.flatnonzero(keys.ne(keys.shift()).to_numpy())
+        for start, end in zip(starts[:-1], starts[1:]):
+            entity = keys.iat[start]
+            if entity in seen:
+                raise ValueError(f"Entitas {entity!r} tidak berurutan; pakai presorted=False (CLI: --unsorted)")
+            seen.add(entity)
+            yield entity, chunk.iloc[start:end]
+        carry = chunk.iloc[starts[-1]:]
+
+    if carry is not None and not carry.empty:
+        entity = carry[entity_col].iat[0]
+        if entity in seen:
+            raise ValueError(f"Entitas {entity!r} tidak berurutan; pakai presorted=False (CLI: --unsorted)")
+        yield entity, carry
+
+
+def iter_partitions(chunks, entity_col, workdir, max_rows=100_000, n_buckets=None, depth=0, max_depth=3):
+    """Kelompokkan data tak terurut lewat partisi hash ke file sementara di `workdir`.
+
+    Setiap chunk dipecah menurut hash teks entitas (tidak bergantung dtype
+    chunk) dan ditambahkan ke satu file CSV per bucket; `n_buckets` idealnya
+    ~ jumlah baris / `max_rows`. Bucket yang masih lebih besar dari `max_rows`
+    dipartisi ulang dengan kunci hash lain (maksimal `max_depth` level), jadi
+    memori dibatasi sekitar `max_rows` baris kecuali satu entitas memang lebih
+    besar dari itu.
+    """
+    n_buckets = n_buckets or 2
+    hash_key = f"partition{depth:07d}"
+    paths, rows = {}, {}
+    for chunk in chunks:
+        chunk = chunk[chunk[entity_col].notna()]
+        keys = chunk[entity_col].astype(str)
+        buckets = pd.util.hash_pandas_object(keys, index=False, hash_key=hash_key).to_numpy() % n_buckets
+        for bucket in np.unique(buckets):
+            part = chunk[buckets == bucket]
+            if bucket not in paths:
+                paths[bucket] = os.path.join(workdir, f"bucket-{depth}-{bucket}.csv")
+                rows[bucket] = 0
+            part.to_csv(paths[bucket], mode="a", header=rows[bucket] == 0, index=False)
+            rows[bucket] += len(part)
+
+    for bucket, path in paths.items():
+        if rows[bucket] > max_rows and depth < max_depth:
+            # Nama file per level (bucket-<depth>-*) tidak bentrok: bucket diproses berurutan dan dihapus setelahnya
+            yield from iter_partitions(iter_chunks(path, chunksize=max_rows, text_columns=[entity_col]), entity_col,
+                                       workdir, max_rows, math.ceil(rows[bucket] / max_rows) + 1, depth + 1,
+                                       max_depth)
+        else:
+            part = _read_bucket(path, entity_col)
+            yield from part.groupby(entity_col, sort=False)
+        os.remove(path)
+
+
+def _read_bucket(path, entity_col):
+    return pd.read_csv(path, dtype={entity_col: str})
+
+
+# ====================== FORECAST PER ENTITAS ======================
+def _forecast_entities(groups, entity_col, columns, year_col, alphas, periods_ahead, metric):
+    # Dijalankan di worker: interpolasi + Brown DES panel untuk setiap entitas x alpha.
+    # Hasil dikumpulkan sebagai array lalu dibentuk jadi tabel long sekali per batch
+    # (melt/join per entitas jauh lebih mahal daripada DES-nya sendiri)
+    settings = ["optimize" if alpha is None else f"{alpha:g}" for alpha in alphas]
+    keys, years, periods, values, scores, best, skipped = [], [], [], [], [], [], []
+    for entity, df in groups:
+        clean = interpolate_numeric(df[[year_col] + columns], year_col)
+        for alpha, setting in zip(alphas, settings):
+            try:
+                panel = forecast_panel(clean, columns, alpha, periods_ahead, year_col, metric=metric)
+            except ValueError:
+                skipped.append(entity)
+                break
+            keys.append((str(entity), setting, len(panel.table)))
+            years.append(panel.table[year_col].to_numpy())
+            periods.append(panel.table["Periode"].to_numpy())
+            values.append(panel.table[columns].to_numpy().T.ravel())
+            scores.append(panel.metrics.to_numpy())
+            best.append(panel.alphas.to_numpy())
+
+    if not keys:
+        return None, None, skipped
+
+    n_cols = len(columns)
+    entities, alpha_settings, n_rows = (np.array(v) for v in zip(*keys))
+    forecasts = pd.DataFrame({
+        entity_col: np.repeat(entities, n_rows * n_cols),
+        "alpha_setting": np.repeat(alpha_settings, n_rows * n_cols),
+        year_col: np.concatenate([np.tile(y, n_cols) for y in years]),
+        "Periode": np.concatenate([np.tile(p, n_cols) for p in periods]),
+        "Seri": np.concatenate([np.repeat(columns, n) for n in n_rows]),
+        "Forecast": np.concatenate(values),
+    })
+
+    metrics = pd.DataFrame(np.vstack(scores), columns=panel.metrics.columns)
+    metrics.insert(0, entity_col, np.repeat(entities, n_cols))
+    metrics.insert(1, "alpha_setting", np.repeat(alpha_settings, n_cols))
+    metrics.insert(2, "Seri", np.tile(columns, len(keys)))
+    metrics.insert(3, "alpha", np.concatenate(best))
+    return forecasts, metrics, skipped
+
+
+def _batches(groups, max_rows):
+    # Gabungkan entitas kecil menjadi satu task sampai sekitar max_rows baris
+    batch, rows = [], 0
+    for entity, df in groups:
+        batch.append((entity, df))
+        rows += len(df)
+        if rows >= max_rows:
+            yield batch
+            batch, rows = [], 0
+    if batch:
+        yield batch
+
+
+# ====================== TULIS INKREMENTAL ======================
+class _IncrementalWriter:
+    """Tulis DataFrame per bagian ke satu file CSV atau Parquet tanpa menahan seluruh hasil di memori."""
+
+    def __init__(self, path, fmt):
+        self.path = path
+        self.fmt = fmt
+        self.rows = 0
+        self._file = None
+        self._writer = None
+        self._schema = None
+
+    def write(self, df):
+        if self.fmt == "csv":
+            if self._file is None:
+                self._file = open(self.path, "w", newline="", encoding="utf-8")
+                df.to_csv(self._file, index=False)
+            else:
+                df.to_csv(self._file, index=False, header=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            if self._writer is None:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                self._schema = table.schema
+                self._writer = pq.ParquetWriter(self.path, self._schema)
+            else:
+                table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+            self._writer.write_table(table)
+        self.rows += len(df)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        if self._writer is not None:
+            self._writer.close()
+
+
+def stream_forecast(path, entity_col, alphas, periods_ahead, output_dir, columns=None, year_col='Year',
+                    metric="MSE", chunksize=100_000, n_jobs=1, presorted=True, n_buckets=None, fmt="csv"):
+    """Interpolasi + Brown DES per entitas untuk panel CSV/Parquet besar, dibaca per chunk.
+
+    File dibaca `chunksize` baris sekaligus dan dikelompokkan per `entity_col`
+    (`presorted=True`: baris satu entitas harus berurutan; False: partisi hash
+    ke file sementara, default `n_buckets` = perkiraan baris / `chunksize`
+    sehingga satu bucket ~ satu chunk). Entitas dikirim per batch ~`chunksize` baris ke process
+    pool (`n_jobs` > 1) dan hasilnya langsung ditulis ke
+    `output_dir/forecasts.<fmt>` dan `metrics.<fmt>` (format long seperti CLI,
+    ditambah kolom entitas). Maksimal 2 x `n_jobs` batch berjalan bersamaan,
+    sehingga memori puncak mengikuti ukuran chunk, bukan ukuran dataset.
+    Entitas dengan kurang dari 4 tahun lengkap dilewati.
+    """
+    if fmt not in ("csv", "parquet"):
+        raise ValueError("fmt harus 'csv' atau 'parquet'")
+    alphas = list(alphas)
+    usecols = None if columns is None else [entity_col, year_col] + list(columns)
+    # Entitas dibaca sebagai teks supaya id yang sama tidak terbaca int di satu chunk dan float di chunk lain
+    chunks = iter_chunks(path, usecols, chunksize, text_columns=[entity_col])
+
+    # Kolom default: semua kolom numerik dari chunk pertama selain entitas & tahun
+    first = next(chunks, None)
+    if first is None:
+        raise ValueError(f"File kosong: {path}")
+    if columns is None:
+        columns = [col for col in numeric_columns(first, year_col) if col != entity_col]
+    columns = list(columns)
+
+    def all_chunks():
+        yield first
+        yield from chunks
+
+    os.makedirs(output_dir, exist_ok=True)
+    forecasts = _IncrementalWriter(os.path.join(output_dir, f"forecasts.{fmt}"), fmt)
+    metrics = _IncrementalWriter(os.path.join(output_dir, f"metrics.{fmt}"), fmt)
+    counts = {"entities": 0, "rows": 0}
+    skipped = []
+
+    def counted(groups):
+        for entity, df in groups:
+            counts["entities"] += 1
+            counts["rows"] += len(df)
+            yield entity, df
+
+    def collect(result):
+        table, scores, missing = result
+        skipped.extend(missing)
+        if table is not None:
+            forecasts.write(table)
+            metrics.write(scores)
+
+    args = (entity_col, columns, year_col, alphas, periods_ahead, metric)
+    with tempfile.TemporaryDirectory(dir=output_dir) as workdir:
+        if presorted:
+            groups = iter_entities(all_chunks(), entity_col)
+        else:
+            n_buckets = n_buckets or max(1, math.ceil(estimate_rows(path) / chunksize))
+            groups = iter_partitions(all_chunks(), entity_col, workdir, chunksize, n_buckets)
+        try:
+            if n_jobs > 1:
+                with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                    pending = deque()
+                    for batch in _batches(counted(groups), chunksize):
+                        pending.append(pool.submit(_forecast_entities, batch, *args))
+                        if len(pending) >= 2 * n_jobs:
+                            collect(pending.popleft().result())
+                    while pending:
+                        collect(pending.popleft().result())
+            else:
+                for batch in _batches(counted(groups), chunksize):
+                    collect(_forecast_entities(batch, *args))
+        finally:
+            forecasts.close()
+            metrics.close()
+
+    return StreamSummary(counts["entities"] - len(skipped), skipped, counts["rows"], forecasts.path, metrics.path)
@@ -1,12 +1,24 @@
+from collections import namedtuple
+
 import streamlit as st
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import os
+
+from app_charts import (chart_backend, render_alpha_curve, render_forecast_chart, render_grid_chart,
+                        render_panel_chart, show_forecast_client, show_panel_client)
+from app_data import (INTERVAL_LEVELS, MAX_PERIODS, N_PATHS, get_forecast_cache, get_forecast_grid,
+                      get_prepared_data)
+from app_ui import finish_page, paged_dataframe, start_page
+from forecasting import (INDICATOR_COLS, brown_params, forecast_panel, forecast_series, forecast_table, grid_forecast,
+                         grid_index, grid_search, optimize_alpha, prediction_intervals, rolling_backtest,
+                         simulate_paths)
+from forecasting.perf import stage
 
 # ====================== PAGE CONFIG & STYLE ======================
 st.set_page_config(page_title="Income Inequality Forecast - DES", layout="wide")
 
+# Waktu render pertama (log server) + pencatatan per tahap (aktif lewat DES_PERF) di panel Performance sidebar
+page_run = start_page("main")
+
 st.markdown("""
 <style>
     .main {background-color: #0E1117; color: #E5E7EB;}
@@ -40,26 +52,87 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ====================== LOAD DATA ======================
-@st.cache_data
-def load_data():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(script_dir, "Income Inequality in South Africa_Dataset.xlsx")
-    df = pd.read_excel(file_path)
-    
-    # Sort berdasarkan tahun (wajib biar interpolasinya benar)
-    df = df.sort_values(by='Year')
-    
-    # Ambil hanya kolom numerik
-    numeric_cols = df.select_dtypes(include='number').columns
-    numeric_cols = [col for col in numeric_cols if col.lower() != 'year']
-    
-    # Interpolasi time series linear
-    for col in numeric_cols:
-        df[col] = df[col].interpolate(method='linear')
-    
-    return df
+# Data hasil sort + interpolasi, dibagi bersama dengan halaman Data Preparation
+prepared = get_prepared_data()
+df_raw = prepared.clean
+
+# ====================== FORECAST & CHART ======================
+CachedForecast = namedtuple("CachedForecast", ["result", "table", "search", "chart", "search_chart", "backtest",
+                                               "intervals"])
+
+# Semua posisi slider Brown (alpha x periode) dihitung sekali per versi dataset; interaksi slider = lookup
+forecast_grid = get_forecast_grid(INTERVAL_LEVELS, N_PATHS, MAX_PERIODS) if len(prepared.target) >= 4 else None
+
+# Pilihan metode DES di sidebar -> nama method di package forecasting
+METHOD_LABELS = {
+    "Brown (α)": "brown",
+    "Holt Linear (α, β)": "holt",
+    "Holt Damped (α, β, φ)": "damped",
+}
+CachedPanel = namedtuple("CachedPanel", ["panel", "chart"])
+
+
+def compute_single(years, Y, method, params, metric, periods_ahead, backend):
+    # params None -> optimasi parameter. Brown: grid alpha padat lalu refine bounded 1-D;
+    # Holt/damped: grid alpha x beta x phi dievaluasi dalam satu batch
+    search = None
+    if params is None:
+        with stage("optimize"):
+            if method == "brown":
+                search = optimize_alpha(Y, metric=metric)
+                params = (search.alpha, None, 1.0)
+            else:
+                search = grid_search(Y, method, metric)
+                params = (search.alpha, search.beta, search.phi)
+    alpha, beta, phi = params
+    with stage("smoothing"):
+        res = forecast_series(years, Y, alpha, periods_ahead, method, beta, phi)
+
+    # Simulasi & backtest memakai bentuk Holt; Brown lewat parameter ekuivalennya
+    holt_params = brown_params(res.alpha) if method == "brown" else (res.alpha, res.beta, res.phi)
+    with stage("intervals"):
+        paths = simulate_paths(res.level[-1], res.trend[-1], *holt_params, res.error, periods_ahead, N_PATHS, seed=0)
+        intervals = prediction_intervals(paths, INTERVAL_LEVELS)
+
+    # Backtest rolling-origin (expanding window, minimal 4 data) untuk horizon 1..periods_ahead
+    max_horizon = min(periods_ahead, len(Y) - 4)
+    backtest = None
+    if max_horizon >= 1:
+        with stage("backtest"):
+            backtest = rolling_backtest(Y, res.alpha, range(1, max_horizon + 1), beta=res.beta, phi=res.phi)
+
+    with stage("charts"):
+        if search is None:
+            search_chart = None
+        elif method == "brown":
+            search_chart = render_alpha_curve(search)
+        else:
+            search_chart = render_grid_chart(search)
+
+        chart = render_forecast_chart(res, intervals) if backend == "matplotlib" else None
+    with stage("table_build"):
+        table = forecast_table(res)
+    return CachedForecast(res, table, search, chart, search_chart, backtest, intervals)
+
+
+def lookup_single(grid, alpha, periods_ahead, backend):
+    # Posisi slider Brown: angka diambil dari tabel precompute, hanya chart & tabel yang dibentuk
+    res, intervals, backtest = grid_forecast(grid, alpha, periods_ahead)
+    with stage("charts"):
+        chart = render_forecast_chart(res, intervals) if backend == "matplotlib" else None
+    with stage("table_build"):
+        table = forecast_table(res)
+    return CachedForecast(res, table, None, chart, None, backtest, intervals)
+
+
+def compute_panel(df, alpha, metric, periods_ahead, backend):
+    # Semua indikator diproses sebagai matriks (tahun x seri) dalam satu sapuan DES
+    with stage("smoothing"):
+        panel = forecast_panel(df, INDICATOR_COLS, alpha, periods_ahead, metric=metric)
+    with stage("charts"):
+        chart = render_panel_chart(df, panel) if backend == "matplotlib" else None
+    return CachedPanel(panel, chart)
 
-df_raw = load_data()
 
 # ====================== TITLE & HEADER ======================
 st.markdown("# Income Inequality in South Africa - Gini Forecast")
@@ -67,8 +140,8 @@ st.markdown("*Forecasting Gini Coefficient menggunakan Double Exponential Smooth
 
 # ====================== DATA DISPLAY ======================
 st.subheader("Data Lengkap - Income Inequality South Africa")
-df_display = df_raw[['Year', 'gini_disp']].copy()
-st.dataframe(df_display, use_container_width=True, hide_index=True)
+df_display = df_raw[['Year', 'gini_disp']]
+paged_dataframe(df_display, key="page_data", use_container_width=True, hide_index=True)
 
 st.markdown("---")
 
@@ -78,26 +151,77 @@ with st.sidebar:
     
     st.markdown("---")
 
-    alpha = st.slider("Alpha (α)", min_value=0.01, max_value=0.99, value=0.60, step=0.01,
-                      help="Semakin tinggi → semakin responsif terhadap data terbaru. Coba 0.1-0.3 untuk data stabil")
+    forecast_mode = st.radio("Mode Forecast", ["Gini (gini_disp)", "Batch Semua Indikator"],
+                             help="Batch memforecast semua indikator hasil Data Preparation sekaligus")
 
-    periods_ahead = st.number_input("Periode Prediksi ke Depan (Tahun)", min_value=1, max_value=20, value=5, step=1)
+    method_label = st.selectbox("Metode DES", list(METHOD_LABELS),
+                                disabled=forecast_mode == "Batch Semua Indikator",
+                                help="Brown: satu parameter. Holt: level & trend terpisah. Damped: trend meredam (φ). "
+                                     "Mode batch selalu memakai Brown.")
+    des_method = METHOD_LABELS[method_label] if forecast_mode != "Batch Semua Indikator" else "brown"
 
-    st.markdown("---")
-    col_btn1, col_btn2 = st.columns(2)
-    with col_btn1:
-        if st.button("Hitung Forecast", type="primary", use_container_width=True):
-            st.session_state.calculate = True
-    with col_btn2:
-        if st.button("Reset", use_container_width=True):
-            st.session_state.calculate = False
-            st.rerun()
+    alpha_mode = st.radio("Mode Alpha", ["Manual", "Optimize α"], horizontal=True,
+                          help="Optimize α mencari parameter dengan error in-sample terkecil secara otomatis")
+
+    if alpha_mode == "Manual":
+        alpha = st.slider("Alpha (α)", min_value=0.01, max_value=0.99, value=0.60, step=0.01,
+                          help="Semakin tinggi → semakin responsif terhadap data terbaru. Coba 0.1-0.3 untuk data stabil")
+        beta, phi = None, 1.0
+        if des_method != "brown":
+            beta = st.slider("Beta (β)", min_value=0.01, max_value=0.99, value=0.30, step=0.01,
+                             help="Smoothing untuk trend. Semakin tinggi → trend lebih cepat berubah")
+        if des_method == "damped":
+            phi = st.slider("Phi (φ)", min_value=0.80, max_value=0.99, value=0.90, step=0.01,
+                            help="Faktor peredam trend untuk prediksi jangka panjang. φ → 1 sama dengan Holt linear")
+    else:
+        opt_metric = st.selectbox("Metrik Optimasi", ["MSE", "MAE", "MAPE"],
+                                  help="Parameter dipilih yang meminimalkan metrik ini pada rentang 0.01-0.99")
+
+    periods_ahead = st.number_input("Periode Prediksi ke Depan (Tahun)", min_value=1, max_value=MAX_PERIODS, value=5,
+                                    step=1)
+    st.caption("Hasil diperbarui langsung setiap kali parameter diubah.")
 
 # ====================== PERHITUNGAN ======================
-if st.session_state.get("calculate", False):
+# Hasil forecast + chart di-cache (LRU) per (versi dataset, method, parameter, periode)
+forecast_cache = get_forecast_cache()
+if alpha_mode == "Manual":
+    method, params, metric = des_method, (alpha, beta, phi), "MSE"
+else:
+    method, params, metric = f"{des_method}-optimize-{opt_metric}", None, opt_metric
+
+if forecast_mode == "Batch Semua Indikator":
+    try:
+        backend = chart_backend(len(df_raw) + periods_ahead)
+        with stage("forecast"):
+            cached = forecast_cache.get_or_compute(
+                (prepared.version, f"batch-{method}", params, periods_ahead, backend),
+                lambda: compute_panel(df_raw, params[0] if params else None, metric, periods_ahead, backend))
+        panel = cached.panel
+
+        in_sample = panel.table[panel.table['Periode'] == "In-sample"]
+        st.success(f"✅ Berhasil! {len(INDICATOR_COLS)} indikator | Data: {len(in_sample)} tahun | "
+                   f"Prediksi {periods_ahead} tahun ke depan")
+
+        st.subheader("📋 Tabel Forecast Semua Indikator")
+        paged_dataframe(panel.table, key="page_batch", float_format="%.4f", use_container_width=True, hide_index=True)
+
+        st.subheader("Matriks Metrik Evaluasi per Indikator")
+        st.dataframe(panel.metrics.assign(Alpha=panel.alphas), use_container_width=True)
+
+        st.subheader("📈 Aktual vs Forecast per Indikator")
+        if cached.chart is not None:
+            st.image(cached.chart, use_container_width=True)
+        else:
+            show_panel_client(df_raw, panel)
+
+    except Exception as e:
+        st.error(f"❌ Terjadi kesalahan: {str(e)}")
+        import traceback
+        st.write(traceback.format_exc())
+else:
     try:
-        # Prepare data dari Excel
-        df_clean = df_raw[['Year', 'gini_disp']].dropna().sort_values('Year').reset_index(drop=True)
+        # Seri Gini tanpa baris kosong, sudah disiapkan sekali per versi dataset (dibagi antar session)
+        df_clean = prepared.target
         
         if len(df_clean) < 4:
             st.error("⚠️ Minimal **4 data** diperlukan untuk Double Exponential Smoothing.")
@@ -107,89 +231,58 @@ if st.session_state.get("calculate", False):
         years = df_clean['Year'].values.astype(int)
         n = len(Y)
 
-        # Double Exponential Smoothing (Brown) - satu parameter alpha
-        S1 = [Y[0]]
-        S2 = [Y[0]]
-        for t in range(1, n):
-            S1.append(alpha * Y[t] + (1 - alpha) * S1[t-1])
-            S2.append(alpha * S1[t] + (1 - alpha) * S2[t-1])
-
-        # Komponen a & b (Brown)
-        a = [2 * S1[i] - S2[i] for i in range(n)]
-        b = [((alpha / (1 - alpha)) * (S1[i] - S2[i])) if (1 - alpha) != 0 else 0.0 for i in range(n)]
-
-        # Forecast in-sample (one-step ahead)
-        forecast = [None]
-        for i in range(1, n):
-            forecast.append(a[i-1] + b[i-1])
-
-        # Error calculation (mulai dari t=1)
-        error = [None]
-        abs_error = [None]
-        error2 = [None]
-        for i in range(1, n):
-            f = forecast[i]
-            if f is None:
-                error.append(None)
-                abs_error.append(None)
-                error2.append(None)
-            else:
-                e = Y[i] - f
-                error.append(e)
-                abs_error.append(abs(e))
-                error2.append(e**2)
-        
-        # Valid errors adalah yang bukan None
-        valid_errors = [e for e in error if e is not None]
-        valid_indices = [i for i in range(n) if error[i] is not None]
-        
-        if len(valid_errors) > 0:
-            MAE = np.mean(np.abs(valid_errors))
-            MSE = np.mean(np.square(valid_errors))
-            RMSE = np.sqrt(MSE)
-            # MAPE (gunakan abs_error dari i=1..n-1)
-            valid_y = np.array([Y[i] for i in valid_indices if Y[i] != 0])
-            valid_abs_error = np.array([abs_error[i] for i in valid_indices if Y[i] != 0])
-            MAPE = float(np.nanmean(valid_abs_error / valid_y) * 100) if len(valid_y) > 0 else 0.0
+        # Optimasi parameter (jika dipilih) + Double Exponential Smoothing + chart
+        backend = chart_backend(n + periods_ahead)
+        if method == "brown" and forecast_grid is not None and grid_index(forecast_grid, alpha) is not None:
+            compute = lambda: lookup_single(forecast_grid, alpha, periods_ahead, backend)
         else:
-            MAE = MSE = RMSE = MAPE = 0
+            compute = lambda: compute_single(years, Y, des_method, params, metric, periods_ahead, backend)
+        with stage("forecast"):
+            cached = forecast_cache.get_or_compute((prepared.version, method, params, periods_ahead, backend), compute)
+        res, search = cached.result, cached.search
+        alpha = res.alpha
+        param_text = f"Alpha = {alpha:.2f}"
+        if res.beta is not None:
+            param_text += f" | Beta = {res.beta:.2f}"
+        if res.method == "damped":
+            param_text += f" | Phi = {res.phi:.2f}"
 
-        # Prediksi ke depan
-        # Forecasting m steps ahead menggunakan a_n dan b_n
-        future_years = [years[-1] + k + 1 for k in range(periods_ahead)]
-        future_forecasts = [a[-1] + b[-1] * m for m in range(1, periods_ahead + 1)]
-        future_years = [years[-1] + k + 1 for k in range(periods_ahead)]
+        MAE, MSE, RMSE, MAPE = (res.metrics[m] for m in ("MAE", "MSE", "RMSE", "MAPE"))
 
         # ====================== HASIL ======================
-        st.success(f"✅ Berhasil! Alpha = {alpha:.2f} | Data: {n} tahun | Prediksi {periods_ahead} tahun ke depan")
+        st.success(f"✅ Berhasil! {method_label} | {param_text} | Data: {n} tahun | "
+                   f"Prediksi {periods_ahead} tahun ke depan")
 
-        # Tabel Perhitungan Lengkap
+        if search is not None and res.method == "brown":
+            st.subheader("🎯 Optimasi Alpha")
+            st.info(f"Alpha optimal = **{search.alpha:.4f}** dengan {search.metric} = **{search.score:.4f}** "
+                    f"(dari {len(search.grid)} kandidat alpha)")
+            st.image(cached.search_chart, use_container_width=True)
+        elif search is not None:
+            st.subheader("🎯 Optimasi Parameter (Grid Search)")
+            n_combos = len(search.alphas) * len(search.betas) * len(search.phis)
+            phi_text = f", φ = **{search.phi:.2f}**" if res.method == "damped" else ""
+            st.info(f"Parameter optimal: α = **{search.alpha:.2f}**, β = **{search.beta:.2f}**{phi_text} "
+                    f"dengan {search.metric} = **{search.score:.4f}** (dari {n_combos:,} kombinasi)")
+            st.image(cached.search_chart, use_container_width=True)
+
+        # Tabel Perhitungan Lengkap (numerik; format 4 desimal diterapkan saat tampil)
         st.subheader("📋 Tabel Perhitungan Lengkap")
-        table_data = []
-        for i in range(n):
-            table_data.append({
-                "No": i + 1,
-                "Tahun": int(years[i]),
-                "Gini Aktual": f"{Y[i]:.4f}",
-                "S1": f"{S1[i]:.4f}",
-                "S2": f"{S2[i]:.4f}",
-                "a": f"{a[i]:.4f}",
-                "b": f"{b[i]:.4f}",
-                "Forecast": f"{forecast[i]:.4f}" if forecast[i] is not None else "-",
-                "Error": f"{error[i]:.4f}" if error[i] is not None else "-",
-                "|Error|": f"{abs_error[i]:.4f}" if abs_error[i] is not None else "-",
-                "Error²": f"{error2[i]:.4f}" if error2[i] is not None else "-",
-            })
-        st.dataframe(pd.DataFrame(table_data), use_container_width=True)
+        paged_dataframe(cached.table, key="page_tabel_perhitungan", float_format="%.4f", use_container_width=True)
 
         # Prediksi Mendatang
         st.subheader(f"Prediksi {periods_ahead} Tahun ke Depan")
         pred_df = pd.DataFrame({
             "No": range(1, periods_ahead + 1),
-            "Tahun": future_years,
-            "Prediksi Gini": [f"{v:.4f}" for v in future_forecasts]
+            "Tahun": res.future_years,
+            "Prediksi Gini": res.future
         })
-        st.dataframe(pred_df, use_container_width=True, hide_index=True)
+        for level in INTERVAL_LEVELS:
+            lower, upper = cached.intervals[level]
+            pred_df[f"Batas Bawah {level}%"] = lower
+            pred_df[f"Batas Atas {level}%"] = upper
+        paged_dataframe(pred_df, key="page_prediksi", float_format="%.4f", use_container_width=True, hide_index=True)
+        st.caption(f"Interval prediksi dari {N_PATHS:,} simulasi jalur DES dengan bootstrap residual in-sample.")
 
         # Metrik Evaluasi
         st.subheader("Metrik Evaluasi Model")
@@ -205,33 +298,21 @@ if st.session_state.get("calculate", False):
             mape_desc = "Sangat Baik" if MAPE < 5 else "Baik" if MAPE < 10 else "Cukup" if MAPE < 20 else "Perlu Perbaikan"
             st.markdown(f"<div class='metric-card'><h3>{mape_color} {MAPE:.2f}%</h3><p>MAPE</p><small>{mape_desc}</small></div>", unsafe_allow_html=True)
 
+        # Backtest out-of-sample: forecast h tahun ke depan dari setiap titik origin
+        if cached.backtest is not None:
+            st.subheader("🔁 Backtest Rolling-Origin (Out-of-Sample)")
+            st.caption("Model di-fit ulang dari setiap tahun origin (minimal 4 data) lalu forecast h tahun ke depan "
+                       "dibandingkan dengan data aktual. Lebih jujur daripada error in-sample di atas.")
+            st.dataframe(cached.backtest.drop(columns="alpha").rename(columns={"horizon": "Horizon (Tahun)",
+                                                                               "n_origins": "Jumlah Origin"}),
+                         use_container_width=True, hide_index=True)
+
         # Grafik Visualisasi (matplotlib style seperti Colab)
         st.subheader("📈 Analisis Visual: Gini Aktual vs Forecast vs Prediksi")
-        
-        # Prepare data untuk visualisasi
-        hasil_forecast_df = pd.DataFrame({
-            'Year': list(years) + future_years,
-            'Forecast_GINI_Disp': forecast + future_forecasts
-        })
-        
-        # Buat figure matplotlib
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        # Plot actual data
-        ax.plot(years, Y, marker='o', label='Actual GINI_Disp', color='#00E396', linewidth=2, markersize=6)
-        
-        # Plot forecast (in-sample + future)
-        ax.plot(hasil_forecast_df['Year'], hasil_forecast_df['Forecast_GINI_Disp'],
-                marker='x', linestyle='--', label='Forecast GINI_Disp', color='#00D1FF', linewidth=2, markersize=8)
-        
-        ax.set_title('Forecasting GINI Dispersion (Double Exponential Smoothing)', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Year', fontsize=12)
-        ax.set_ylabel('GINI Disp', fontsize=12)
-        ax.legend(loc='best', fontsize=10)
-        ax.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        st.pyplot(fig)
+        if cached.chart is not None:
+            st.image(cached.chart, use_container_width=True)
+        else:
+            show_forecast_client(res, cached.intervals)
 
         # ====================== PANDUAN ======================
         st.markdown("---")
@@ -276,9 +357,8 @@ if st.session_state.get("calculate", False):
         st.error(f"❌ Terjadi kesalahan: {str(e)}")
         import traceback
         st.write(traceback.format_exc())
-else:
-    st.info("👈 Klik **Hitung Forecast** di sidebar untuk memulai analisis forecasting Gini Coefficient.")
-    
+
+with st.expander("ℹ️ Tentang Dataset & Cara Menggunakan"):
     col1, col2 = st.columns(2)
     with col1:
         st.markdown("""
@@ -292,12 +372,17 @@ else:
     with col2:
         st.markdown("""
         ### Cara Menggunakan
-        1. Gunakan slider **Alpha (α)** untuk mengatur sensitivitas
+        1. Gunakan slider **Alpha (α)** untuk mengatur sensitivitas, atau pilih mode **Optimize α** untuk mencari alpha terbaik otomatis
         2. Pilih berapa tahun prediksi ke depan
-        3. Klik **Hitung Forecast** untuk melihat hasil
+        3. Hasil, tabel dan grafik diperbarui langsung setiap kali parameter diubah
         4. Gunakan kontrol grafik untuk menyesuaikan tampilan
         5. Lihat tabel dan metrik untuk analisis detail
 
         """)
 
+with st.sidebar:
+    stats = forecast_cache.stats()
+    st.caption(f"Cache forecast: {stats['hits']} hit · {stats['misses']} miss · "
+               f"{stats['size']}/{stats['maxsize']} entri")
 
+finish_page(page_run)
@@ -0,0 +1,37 @@
+"""Jalankan aplikasi Streamlit dengan cache yang sudah dipanaskan saat boot.
+
+Contoh:
+    python serve.py main.py --server.port 8501 --server.headless true
+    python serve.py data_preparation.py
+
+Dataset, preprocessing, profil dan grid forecast Brown dihitung sebelum port
+dibuka (lihat app_data.prewarm), sehingga health check replika baru lulus
+setelah cache siap dan user pertama tidak menanggung parsing XLSX. Argumen
+sesudah nama halaman diteruskan ke `streamlit run`. Setiap halaman mencatat
+time-to-first-render ke log saat pertama dirender di proses ini.
+"""
+import sys
+import time
+
+from forecasting.perf import BOOT_TIME
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0].startswith("-"):
+        print(__doc__)
+        return 2
+
+    from app_data import prewarm
+    recorder = prewarm()
+    for record in recorder.to_dict()["stages"]:
+        print(f"Prewarm {record['stage']:<14} {record['seconds'] * 1e3:10,.1f} ms", flush=True)
+    print(f"Cache siap dalam {recorder.total_seconds():.2f} s ({time.perf_counter() - BOOT_TIME:.2f} s sejak boot)",
+          flush=True)
+
+    from streamlit.web import cli
+    return cli.main(["run", *argv], prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
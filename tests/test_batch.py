@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting import des, forecast_panel
+
+
+def panel(n_rows=40, n_cols=12, seed=5):
+    rng = np.random.default_rng(seed)
+    values = 40 + np.cumsum(rng.normal(0, 1, (n_rows, n_cols)), axis=0)
+    values[:, 0] -= 60  # satu seri negatif: MAPE harus tetap positif
+    df = pd.DataFrame(values, columns=[f"x{i}" for i in range(n_cols)])
+    df.insert(0, "Year", np.arange(1980, 1980 + n_rows))
+    return df, list(df.columns[1:])
+
+
+@pytest.mark.parametrize("metric", ["MSE", "MAPE"])
+def test_forecast_panel_optimize_independent_of_block_size(monkeypatch, metric):
+    df, cols = panel()
+    whole = forecast_panel(df, cols, None, 4, metric=metric)
+    monkeypatch.setattr(des, "GRID_BLOCK_ELEMENTS", 7 * 40 * len(cols))
+    blocked = forecast_panel(df, cols, None, 4, metric=metric)
+    pd.testing.assert_frame_equal(blocked.table, whole.table, check_exact=True)
+    pd.testing.assert_frame_equal(blocked.metrics, whole.metrics, check_exact=True)
+    pd.testing.assert_series_equal(blocked.alphas, whole.alphas, check_exact=True)
+    assert (whole.metrics["MAPE"] >= 0).all()
+
+
+def test_forecast_panel_optimize_matches_single_series():
+    df, cols = panel()
+    result = forecast_panel(df, cols, None, 4)
+    for col in cols:
+        single = forecast_panel(df, [col], None, 4)
+        assert single.alphas[col] == result.alphas[col]
+        np.testing.assert_array_equal(single.table[col], result.table[col])
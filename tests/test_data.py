@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting import compact_frame, interpolate_frame
+
+
+def frame_with_gaps(years, seed=0):
+    rng = np.random.default_rng(seed)
+    n = len(years)
+    values = 40 + np.cumsum(rng.normal(0, 1, (n, 3)), axis=0)
+    values[rng.random((n, 3)) < 0.3] = np.nan
+    values[:2, 0] = np.nan   # NaN di awal tetap NaN
+    values[-3:, 1] = np.nan  # NaN di akhir diisi nilai terakhir
+    df = pd.DataFrame(values, columns=["a", "b", "c"])
+    df.insert(0, "Year", years)
+    return df.sample(frac=1, random_state=seed)  # urutan acak: interpolate_frame wajib sort dulu
+
+
+@pytest.mark.parametrize("years", [np.arange(1970, 2020), np.array([2001, 2002, 2005, 2006, 2010, 2011, 2012, 2020,
+                                                                     2021, 2030, 2031, 2035])])
+@pytest.mark.parametrize("limit", [None, 1, 2])
+def test_interpolate_frame_matches_series_interpolate(years, limit):
+    df = frame_with_gaps(years)
+    result = interpolate_frame(df, limit=limit)
+
+    expected = df.sort_values("Year").set_index("Year")
+    expected = expected.apply(lambda s: s.interpolate(method="index", limit=limit))
+    pd.testing.assert_frame_equal(result.frame.set_index("Year"), expected, check_exact=True)
+
+    original = df.sort_values("Year").reset_index(drop=True)
+    filled = result.frame[["a", "b", "c"]].notna() & original[["a", "b", "c"]].isna()
+    assert result.filled.to_dict() == filled.sum().to_dict()
+
+
+def test_compact_frame_only_downcasts_recorded_precision():
+    df = pd.DataFrame({
+        "Year": [2000, 2001, 2002],
+        "gini": [59.2, np.nan, 24.1],                        # 3 digit: float32 tanpa kehilangan
+        "gdp": [164842286098.0996, 1.5, 2.5],                # penuh presisi: tetap float64
+        "big": [123456789.123, 1.0, 2.0],                    # lolos rentang float32 tapi > 6 digit
+    })
+    compact = compact_frame(df)
+    assert compact.dtypes.astype(str).to_dict() == {"Year": "int16", "gini": "float32", "gdp": "float64",
+                                                    "big": "float64"}
+    restored = [float(f"{v:.6g}") for v in compact["gini"].dropna()]
+    assert restored == [59.2, 24.1]
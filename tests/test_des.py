@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from forecasting import brown_des
+
+
+def brown_loop(Y, alpha):
+    # Rekursi list asli dari main.py sebelum kernel vektor (acuan bit-exact)
+    n = len(Y)
+    S1 = [Y[0]]
+    S2 = [Y[0]]
+    for t in range(1, n):
+        S1.append(alpha * Y[t] + (1 - alpha) * S1[t-1])
+        S2.append(alpha * S1[t] + (1 - alpha) * S2[t-1])
+    a = [2 * S1[i] - S2[i] for i in range(n)]
+    b = [((alpha / (1 - alpha)) * (S1[i] - S2[i])) if (1 - alpha) != 0 else 0.0 for i in range(n)]
+    forecast = [np.nan] + [a[t-1] + b[t-1] for t in range(1, n)]
+    return S1, S2, a, b, forecast
+
+
+def series(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return 40 + np.cumsum(rng.normal(0.05, 0.8, n))
+
+
+@pytest.mark.parametrize("n, alphas", [
+    (47, np.round(np.arange(1, 100) / 100, 2)),    # k > n: rekursi per waktu untuk semua alpha
+    (200, np.array([0.05, 0.3, 0.6, 0.99, 1.0])),  # k <= n: lfilter per alpha
+])
+def test_brown_des_matches_list_recursion(n, alphas):
+    y = series(n)
+    res = brown_des(y, alphas)
+    for i, alpha in enumerate(alphas):
+        expected = brown_loop(list(y), float(alpha))
+        for got, want in zip((res.s1, res.s2, res.level, res.trend, res.forecast), expected):
+            np.testing.assert_array_equal(got[i], np.array(want))
+
+
+def test_brown_des_panel_matches_columns():
+    y = np.column_stack([series(30, seed) for seed in range(4)])
+    alphas = [0.2, 0.7]
+    panel = brown_des(y, alphas)
+    for j in range(y.shape[1]):
+        single = brown_des(y[:, j], alphas)
+        np.testing.assert_array_equal(panel.forecast[:, :, j], single.forecast)
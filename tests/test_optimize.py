@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+from forecasting import des, optimize_alpha
+
+
+@pytest.mark.parametrize("metric", ["MSE", "MAPE"])
+def test_optimize_alpha_independent_of_block_size(monkeypatch, metric):
+    y = 40 + np.random.default_rng(3).normal(0, 1, 300).cumsum()
+    whole = optimize_alpha(y, metric=metric)
+    monkeypatch.setattr(des, "GRID_BLOCK_ELEMENTS", 7 * y.size)  # blok 7 alpha, blok terakhir tidak penuh
+    blocked = optimize_alpha(y, metric=metric)
+    assert (blocked.alpha, blocked.score) == (whole.alpha, whole.score)
+    for name, curve in whole.scores.items():
+        np.testing.assert_array_equal(blocked.scores[name], curve)
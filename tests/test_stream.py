@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+from forecasting import stream_forecast
+from forecasting import stream
+from forecasting.stream import iter_chunks, iter_partitions
+
+
+def panel_csv(path, n_entities=6, n_years=20, seed=0):
+    # Panel tidak terurut dengan id entitas numerik; dua sel id kosong membuat
+    # chunk yang memuatnya terbaca float64 oleh read_csv, chunk lain int64
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "cid": np.repeat(np.arange(1, n_entities + 1), n_years).astype(object),
+        "Year": np.tile(np.arange(2000, 2000 + n_years), n_entities),
+        "x": 40 + rng.normal(0, 1, n_entities * n_years).cumsum(),
+    }).sample(frac=1, random_state=seed).reset_index(drop=True)
+    df.loc[[7, 93], "cid"] = None
+    df.to_csv(path, index=False)
+    return df
+
+
+def test_unsorted_numeric_entities_are_not_split(tmp_path):
+    panel_csv(tmp_path / "panel.csv")
+    summary = stream_forecast(str(tmp_path / "panel.csv"), "cid", [0.5], 3, str(tmp_path / "out"),
+                              chunksize=40, presorted=False)
+    metrics = pd.read_csv(summary.metrics_path)
+    assert summary.entities == 6 and not summary.skipped
+    assert sorted(metrics["cid"]) == [1, 2, 3, 4, 5, 6]
+
+
+def test_unsorted_matches_presorted(tmp_path):
+    df = panel_csv(tmp_path / "panel.csv")
+    df.dropna(subset=["cid"]).sort_values(["cid", "Year"]).to_csv(tmp_path / "sorted.csv", index=False)
+    kwargs = dict(alphas=[0.3, None], periods_ahead=2, chunksize=25)
+    unsorted = stream_forecast(str(tmp_path / "panel.csv"), "cid", output_dir=str(tmp_path / "a"),
+                               presorted=False, **kwargs)
+    presorted = stream_forecast(str(tmp_path / "sorted.csv"), "cid", output_dir=str(tmp_path / "b"), **kwargs)
+    a = pd.read_csv(unsorted.forecasts_path).sort_values(["cid", "alpha_setting", "Year"], ignore_index=True)
+    b = pd.read_csv(presorted.forecasts_path).sort_values(["cid", "alpha_setting", "Year"], ignore_index=True)
+    pd.testing.assert_frame_equal(a, b)
+
+
+def test_partitions_stay_near_chunksize(tmp_path, monkeypatch):
+    # Bucket awal sengaja terlalu sedikit: bucket besar harus dipartisi ulang, bukan dibaca utuh
+    df = pd.DataFrame({"cid": np.repeat(np.arange(400), 10), "Year": np.tile(np.arange(10), 400), "x": 1.0})
+    df.sample(frac=1, random_state=1).to_csv(tmp_path / "big.csv", index=False)
+    read = []
+    original = stream._read_bucket
+    monkeypatch.setattr(stream, "_read_bucket", lambda path, col: read.append(original(path, col)) or read[-1])
+
+    chunks = iter_chunks(str(tmp_path / "big.csv"), chunksize=500, text_columns=["cid"])
+    sizes = [len(group) for _, group in iter_partitions(chunks, "cid", str(tmp_path), max_rows=500, n_buckets=2)]
+    assert sum(sizes) == len(df) and len(sizes) == 400
+    assert max(len(part) for part in read) <= 500
+    assert list(tmp_path.glob("**/bucket-*")) == []